@@ -0,0 +1,74 @@
+# cython: language_level=3
+"""
+main.py 유틸 함수의 C 구현(선택 사항).
+빌드: cythonize -i fastutils.pyx  (없으면 main.py의 순수 파이썬 구현 사용)
+"""
+
+
+cpdef str hms(long long seconds):
+    if seconds < 0:
+        seconds = 0
+    cdef long long h = seconds // 3600
+    cdef long long m = (seconds % 3600) // 60
+    cdef long long s = seconds % 60
+    return f"{h}:{m:02d}:{s:02d}"
+
+
+cpdef str safe_date_yyyymmdd(s):
+    """
+    yt-dlp dateafter/datebefore 옵션용으로 YYYYMMDD만 반환(유효하지 않으면 "").
+    구분자(- / .)를 건너뛰며 한 번의 루프로 숫자 8개를 모음.
+    """
+    if not s:
+        return ""
+    cdef str t = s.strip()
+    cdef char buf[8]
+    cdef int n = 0
+    cdef Py_UCS4 c
+    for c in t:
+        if c == u'-' or c == u'/' or c == u'.':
+            continue
+        if c < u'0' or c > u'9' or n >= 8:
+            return ""
+        buf[n] = <char>c
+        n += 1
+    if n != 8:
+        return ""
+    return buf[:8].decode("ascii")
+
+
+cpdef str strip_ansi(s):
+    """
+    ANSI 색상 코드(ESC [ 숫자;... m) 제거. 문자열을 한 번만 훑으며 남길 구간만 이어 붙임.
+    """
+    if not s:
+        return ""
+    cdef str t = s
+    cdef Py_ssize_t n = len(t)
+    cdef Py_ssize_t i = 0, j, keep = 0
+    cdef Py_UCS4 c
+    cdef list parts = None
+    if u'\x1b' not in t:
+        return t
+    while i < n:
+        if t[i] != u'\x1b' or i + 1 >= n or t[i + 1] != u'[':
+            i += 1
+            continue
+        j = i + 2
+        while j < n:
+            c = t[j]
+            if (c < u'0' or c > u'9') and c != u';':
+                break
+            j += 1
+        if j < n and t[j] == u'm':
+            if parts is None:
+                parts = []
+            parts.append(t[keep:i])
+            keep = j + 1
+            i = j + 1
+        else:
+            i += 1
+    if parts is None:
+        return t
+    parts.append(t[keep:])
+    return "".join(parts)
@@ -5,27 +5,46 @@ import time
 import atexit
 import faulthandler
 import shutil
+import threading
+import queue
+import weakref
+import multiprocessing
 from pathlib import Path
-from dataclasses import dataclass
-from datetime import timedelta
+from dataclasses import dataclass, field
+from functools import lru_cache
 from collections import deque
+from collections.abc import Iterator
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeout
+from concurrent.futures.process import BrokenProcessPool
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 if BASE_DIR not in sys.path:
     sys.path.insert(0, BASE_DIR)
 
+import xxhash
 import yt_dlp
+from diskcache import Cache
+
+import themes_rc  # noqa: F401  (pyside6-rcc themes.qrc -o themes_rc.py)
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
 
 from PySide6.QtCore import (
     Qt, QObject, QThread, Signal, Slot, QSettings, QMimeData,
-    qInstallMessageHandler, QTimer
+    qInstallMessageHandler, QtMsgType, QTimer, QThreadPool, QRunnable, QFile, QIODevice,
+    QAbstractTableModel, QModelIndex, QEvent, QStandardPaths
 )
 from PySide6.QtGui import QAction, QKeySequence, QPalette, QColor
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
-    QLineEdit, QPushButton, QLabel, QTableWidget, QTableWidgetItem, QHeaderView,
+    QLineEdit, QPushButton, QLabel, QTableView, QHeaderView,
     QFileDialog, QMessageBox, QProgressBar, QPlainTextEdit, QToolBar, QCheckBox,
-    QComboBox, QGroupBox, QFormLayout, QTabWidget
+    QComboBox, QGroupBox, QFormLayout, QTabWidget, QSpinBox
 )
 
 # -------------------- Crash/Qt logs --------------------
@@ -33,76 +52,270 @@ APP_DIR = os.path.dirname(os.path.abspath(__file__))
 CRASH_LOG_PATH = os.path.join(APP_DIR, "crash.log")
 QT_LOG_PATH = os.path.join(APP_DIR, "qt.log")
 
+# 채널/재생목록 flat 목록 캐시(같은 URL 재확장 시 네트워크 생략)
+EXPAND_CACHE_TTL = 6 * 3600
+_expand_cache_obj: Cache | None = None
+_expand_cache_lock = threading.Lock()
+
+
+def _expand_cache() -> Cache:
+    """
+    사용자별 데이터 폴더(AppDataLocation)의 캐시를 처음 쓸 때 연다.
+    확장 자식 프로세스도 main.py를 다시 import하므로 import 시점에는 만들지 않음.
+    """
+    global _expand_cache_obj
+    with _expand_cache_lock:
+        if _expand_cache_obj is None:
+            base = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation) or APP_DIR
+            _expand_cache_obj = Cache(os.path.join(base, "expand_cache"), size_limit=512 << 20)
+        return _expand_cache_obj
+
+
+# 로그 파일 쓰기는 큐에 넣고 백그라운드 스레드가 모아서(8KB 또는 100ms 단위) 한 번에 기록
+LOG_FLUSH_BYTES = 8 << 10
+LOG_FLUSH_INTERVAL = 0.1
+_LOG_Q: queue.Queue = queue.Queue()
+_log_thread: threading.Thread | None = None
+_log_thread_lock = threading.Lock()
+_LOG_CLOSE = object()  # (fd, _LOG_CLOSE): 남은 로그를 쓴 뒤 기록 스레드가 fd를 닫음
+
+
+def _log_drain():
+    pending: dict[int, list[bytes]] = {}
+    size = 0
+    deadline = None
+    while True:
+        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+        try:
+            fd, data = _LOG_Q.get(timeout=timeout)
+        except queue.Empty:
+            fd, data = None, None
+
+        flush_now = fd is None
+        close_fd = None
+        if data is _LOG_CLOSE:
+            close_fd, flush_now = fd, True
+        elif fd is not None:
+            pending.setdefault(fd, []).append(data)
+            size += len(data)
+            if deadline is None:
+                deadline = time.monotonic() + LOG_FLUSH_INTERVAL
+
+        if flush_now or size >= LOG_FLUSH_BYTES or time.monotonic() >= deadline:
+            for pfd, chunks in pending.items():
+                try:
+                    os.write(pfd, b"".join(chunks))
+                except OSError:
+                    pass
+            pending.clear()
+            size = 0
+            deadline = None
+            if close_fd is not None:
+                try:
+                    os.close(close_fd)
+                except OSError:
+                    pass
+            if isinstance(data, threading.Event):
+                data.set()
+
+
+def _log_open(path: str) -> int:
+    global _log_thread
+    with _log_thread_lock:
+        if _log_thread is None:
+            _log_thread = threading.Thread(target=_log_drain, name="log-writer", daemon=True)
+            _log_thread.start()
+    flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+    return os.open(path, flags, 0o644)
+
+
+def _log_write(fd: int, text: str):
+    _LOG_Q.put((fd, text.encode("utf-8")))
+
+
+def _log_flush(timeout: float = 2.0):
+    """
+    큐에 쌓인 로그를 즉시 기록하고 완료될 때까지(최대 timeout초) 대기.
+    """
+    if _log_thread is None:
+        return
+    done = threading.Event()
+    _LOG_Q.put((None, done))
+    done.wait(timeout)
+
+
+def _log_close(fd: int):
+    """
+    닫기도 기록 스레드에 맡김. flush 대기가 시간 초과돼도 쓰는 중인 fd를 닫지 않음.
+    """
+    if _log_thread is None:
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+        return
+    _LOG_Q.put((fd, _LOG_CLOSE))
+    _log_flush()
+
 
 def _setup_faulthandler():
-    fp = open(CRASH_LOG_PATH, "a", encoding="utf-8")
-    faulthandler.enable(fp)
-    fp.write(f"\n=== session start {time.strftime('%Y-%m-%d %H:%M:%S')} ===\n")
-    fp.flush()
+    fd = _log_open(CRASH_LOG_PATH)
+    faulthandler.enable(fd)
+    _log_write(fd, f"\n=== session start {time.strftime('%Y-%m-%d %H:%M:%S')} ===\n")
 
     def _on_exit():
         try:
-            fp.write(f"=== atexit {time.strftime('%Y-%m-%d %H:%M:%S')} ===\n")
-            fp.flush()
+            _log_write(fd, f"=== atexit {time.strftime('%Y-%m-%d %H:%M:%S')} ===\n")
+            _log_flush()
         except Exception:
             pass
 
     atexit.register(_on_exit)
-    return fp
+    return fd
 
 
 def _setup_qt_message_log():
-    fp = open(QT_LOG_PATH, "a", encoding="utf-8")
-    fp.write(f"\n=== qt session start {time.strftime('%Y-%m-%d %H:%M:%S')} ===\n")
-    fp.flush()
+    fd = _log_open(QT_LOG_PATH)
+    _log_write(fd, f"\n=== qt session start {time.strftime('%Y-%m-%d %H:%M:%S')} ===\n")
 
-    def handler(_mode, _context, message):
+    def handler(mode, _context, message):
         try:
-            fp.write(message + "\n")
-            fp.flush()
+            if mode == QtMsgType.QtFatalMsg:
+                # 곧 abort되므로 큐를 비우고 직접 기록
+                _log_flush()
+                os.write(fd, (message + "\n").encode("utf-8"))
+            else:
+                _log_write(fd, message + "\n")
         except Exception:
             pass
 
     qInstallMessageHandler(handler)
-    return fp
+    return fd
 
 
 # -------------------- Utilities --------------------
 ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
 URL_RE = re.compile(r"https?://[^\s]+")
 TAB_SUFFIXES = ("videos", "streams", "live", "shorts", "featured", "playlists")
+TAB_PROBE_COUNT = 5
+VIDEO_URL_RE = re.compile(r"^https?://(?:www\.|m\.)?(?:youtu\.be/|youtube\.com/(?:watch\?|shorts/))", re.I)
+CHANNEL_URL_RE = re.compile(r"youtube\.com/(?:@|channel/|c/|user/)", re.I)
+_xxh64 = xxhash.xxh64_intdigest
+
+
+def _hs_compile(pattern: bytes):
+    db = hyperscan.Database()
+    db.compile(expressions=[pattern], ids=[0], flags=[hyperscan.HS_FLAG_SOM_LEFTMOST])
+    return db
+
+
+# hyperscan이 설치돼 있으면 URL 스캔을 DFA로 처리(없으면 re 사용).
+# ANSI 제거는 짧은 진행률 문자열이라 인코딩 비용이 더 커서 제외(fastutils C 구현 → re 순)
+_HS_URL_DB = _hs_compile(rb"https?://[^\s]+") if hyperscan else None
+_hs_local = threading.local()
+
+
+def _hs_spans(db, data: bytes) -> list[list[int]]:
+    """
+    매치 구간 [start, end] 목록. 같은 시작점에서 끝점이 여러 번 보고되면 가장 긴 것만 남김.
+    """
+    scratches = getattr(_hs_local, "scratches", None)
+    if scratches is None:
+        scratches = _hs_local.scratches = {}
+    scratch = scratches.get(id(db))
+    if scratch is None:
+        scratch = scratches[id(db)] = hyperscan.Scratch(db)
+
+    spans: list[list[int]] = []
+
+    def on_match(_id, start, end, _flags, ctx):
+        if ctx and ctx[-1][0] == start:
+            ctx[-1][1] = end
+        else:
+            ctx.append([start, end])
+
+    db.scan(data, match_event_handler=on_match, context=spans, scratch=scratch)
+    return spans
 
 
 def strip_ansi(s: str) -> str:
-    return ANSI_RE.sub("", s or "")
+    if not s or "\x1b" not in s:
+        return s or ""
+    return ANSI_RE.sub("", s)
 
 
 def hms(seconds: int) -> str:
+    seconds = int(seconds)
     if seconds < 0:
         seconds = 0
-    return str(timedelta(seconds=int(seconds)))
+    h, rem = divmod(seconds, 3600)
+    m, sec = divmod(rem, 60)
+    return f"{h}:{m:02d}:{sec:02d}"
 
 
+@lru_cache(maxsize=1)
 def app_base_path() -> str:
     if hasattr(sys, "_MEIPASS"):
         return sys._MEIPASS
     return os.path.dirname(os.path.abspath(__file__))
 
 
-def ffmpeg_location() -> str | None:
+@lru_cache(maxsize=1)
+def ffmpeg_paths() -> tuple[str, str, str]:
+    """
+    (기준 폴더, ffmpeg.exe, ffprobe.exe) 경로. 실행 중에는 바뀌지 않으므로 한 번만 계산.
+    """
     base = app_base_path()
-    ffmpeg = os.path.join(base, "ffmpeg.exe")
-    ffprobe = os.path.join(base, "ffprobe.exe")
-    if os.path.exists(ffmpeg) and os.path.exists(ffprobe):
-        return base
-    return None
+    return base, os.path.join(base, "ffmpeg.exe"), os.path.join(base, "ffprobe.exe")
+
+
+@lru_cache(maxsize=1)
+def ffmpeg_location() -> str | None:
+    base, ffmpeg, ffprobe = ffmpeg_paths()
+    try:
+        os.stat(ffmpeg)
+        os.stat(ffprobe)
+    except OSError:
+        return None
+    return base
+
+
+@lru_cache(maxsize=1)
+def aria2c_location() -> str | None:
+    """
+    ffmpeg와 같은 폴더에 aria2c.exe가 있으면 경로 반환(외부 다운로더용).
+    """
+    p = os.path.join(app_base_path(), "aria2c.exe")
+    try:
+        os.stat(p)
+    except OSError:
+        return None
+    return p
 
 
 def extract_urls_from_text(text: str) -> list[str]:
-    urls = URL_RE.findall(text or "")
+    if _HS_URL_DB is not None and text:
+        data = text.encode("utf-8")
+        urls = []
+        for a, b in _hs_spans(_HS_URL_DB, data):
+            u = data[a:b].decode("utf-8", "ignore")
+            # 바이트 패턴의 \s는 ASCII 공백만 끊으므로, 비ASCII 구간은 URL_RE로 다시 나눔(\u3000 등)
+            if u.isascii():
+                urls.append(u)
+            else:
+                urls.extend(URL_RE.findall(u))
+    else:
+        urls = URL_RE.findall(text or "")
     return [u.strip().strip(")>]}.,") for u in urls]
 
 
+def url_hash(url: str) -> int:
+    """
+    대기열 중복 검사용 64비트 해시. 충돌 확률(약 2^-64)은 무시할 수 있는 수준.
+    """
+    return _xxh64(url.encode("utf-8"))
+
+
 def normalize_url(url: str) -> str:
     return (url or "").strip()
 
@@ -122,6 +335,21 @@ def normalize_channel_to_videos(url: str) -> str:
     return u
 
 
+def is_shorts_url(url: str) -> bool:
+    return "/shorts/" in (url or "").lower()
+
+
+def url_kind(url: str) -> str:
+    """
+    확장 옵션 선택용 URL 종류: "video" / "channel" / "playlist"(그 외 전부).
+    """
+    if VIDEO_URL_RE.match(url) and "list=" not in url:
+        return "video"
+    if CHANNEL_URL_RE.search(url):
+        return "channel"
+    return "playlist"
+
+
 def looks_like_tab_entry(e: dict) -> bool:
     if not isinstance(e, dict):
         return False
@@ -131,6 +359,41 @@ def looks_like_tab_entry(e: dict) -> bool:
     return any(u.rstrip("/").endswith("/" + t) for t in TAB_SUFFIXES)
 
 
+def slim_flat_info(info):
+    """
+    캐시 저장용으로 확장에 필요한 필드(title, entries의 url/webpage_url/title)만 남김.
+    """
+    if not isinstance(info, dict):
+        return info
+    out = {"title": info.get("title")}
+    entries = info.get("entries")
+    if entries is not None:
+        out["entries"] = [
+            {"url": e.get("url"), "webpage_url": e.get("webpage_url"), "title": e.get("title")}
+            if isinstance(e, dict) else None
+            for e in entries
+        ]
+    return out
+
+
+def split_entries_head(info, k: int) -> tuple[list[dict], Iterator]:
+    """
+    info["entries"]에서 None이 아닌 앞쪽 k개와, 아직 소비하지 않은 나머지 이터레이터를 반환.
+    """
+    entries = info.get("entries") if isinstance(info, dict) else None
+    it = iter(entries or ())
+    head: list[dict] = []
+    for e in it:
+        if e:
+            head.append(e)
+            if len(head) >= k:
+                break
+    return head, it
+
+
+_DATE_SEP_TABLE = str.maketrans("", "", "-/.")
+
+
 def safe_date_yyyymmdd(s: str) -> str:
     """
     yt-dlp dateafter/datebefore 옵션용으로 YYYYMMDD만 반환(유효하지 않으면 "").
@@ -138,12 +401,53 @@ def safe_date_yyyymmdd(s: str) -> str:
     t = (s or "").strip()
     if not t:
         return ""
-    t = t.replace("-", "").replace("/", "").replace(".", "")
-    if len(t) != 8 or not t.isdigit():
+    t = t.translate(_DATE_SEP_TABLE)
+    if len(t) != 8 or not (t.isascii() and t.isdigit()):
         return ""
     return t
 
 
+# fastutils.pyx가 빌드돼 있으면 C 구현 사용
+try:
+    from fastutils import hms, safe_date_yyyymmdd, strip_ansi  # noqa: F811
+except ImportError:
+    pass
+
+
+_QUALITY_HEIGHTS = (("1440", 1440), ("1080", 1080), ("720", 720), ("480", 480), ("360", 360), ("240", 240), ("144", 144))
+
+
+@lru_cache(maxsize=32)
+def _quality_to_height(text: str) -> int:
+    t = text.lower()
+    if "4320" in t or "8k" in t:
+        return 4320
+    if "2160" in t or "4k" in t:
+        return 2160
+    for key, n in _QUALITY_HEIGHTS:
+        if key in t:
+            return n
+    return 1080
+
+
+def coerce_setting(value, default, typ):
+    """
+    QSettings 원시 값(INI/레지스트리에서는 "true"/"false" 같은 문자열)을 typ으로 변환.
+    """
+    if value is None:
+        return default
+    if typ is bool:
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, str):
+            return value.strip().lower() in ("true", "1", "yes", "on")
+        return bool(value)
+    try:
+        return typ(value)
+    except (TypeError, ValueError):
+        return default
+
+
 def detect_js_runtimes() -> dict[str, dict]:
     """
     yt-dlp --js-runtimes RUNTIME[:PATH] 개념에 맞춰
@@ -170,283 +474,430 @@ def detect_js_runtimes() -> dict[str, dict]:
 
 
 # -------------------- Themes --------------------
-def palette_dark_discord() -> QPalette:
-    p = QPalette()
-    p.setColor(QPalette.Window, QColor("#36393F"))
-    p.setColor(QPalette.WindowText, QColor("#DCDDDE"))
-    p.setColor(QPalette.Base, QColor("#2F3136"))
-    p.setColor(QPalette.AlternateBase, QColor("#2B2D31"))
-    p.setColor(QPalette.Text, QColor("#DCDDDE"))
-    p.setColor(QPalette.Button, QColor("#2F3136"))
-    p.setColor(QPalette.ButtonText, QColor("#DCDDDE"))
-    p.setColor(QPalette.Highlight, QColor("#5865F2"))
-    p.setColor(QPalette.HighlightedText, QColor("#FFFFFF"))
-    return p
+THEME_COLORS: dict[str, dict[str, str]] = {
+    "dark": {
+        "Window": "#36393F",
+        "WindowText": "#DCDDDE",
+        "Base": "#2F3136",
+        "AlternateBase": "#2B2D31",
+        "Text": "#DCDDDE",
+        "Button": "#2F3136",
+        "ButtonText": "#DCDDDE",
+        "Highlight": "#5865F2",
+        "HighlightedText": "#FFFFFF",
+    },
+    "light": {
+        "Window": "#F4F5F7",
+        "WindowText": "#111827",
+        "Base": "#FFFFFF",
+        "AlternateBase": "#F3F4F6",
+        "Text": "#111827",
+        "Button": "#E5E7EB",
+        "ButtonText": "#111827",
+        "Highlight": "#2563EB",
+        "HighlightedText": "#FFFFFF",
+    },
+}
 
 
-def palette_light_clean() -> QPalette:
+def _build_palette(colors: dict[str, str]) -> QPalette:
     p = QPalette()
-    p.setColor(QPalette.Window, QColor("#F4F5F7"))
-    p.setColor(QPalette.WindowText, QColor("#111827"))
-    p.setColor(QPalette.Base, QColor("#FFFFFF"))
-    p.setColor(QPalette.AlternateBase, QColor("#F3F4F6"))
-    p.setColor(QPalette.Text, QColor("#111827"))
-    p.setColor(QPalette.Button, QColor("#E5E7EB"))
-    p.setColor(QPalette.ButtonText, QColor("#111827"))
-    p.setColor(QPalette.Highlight, QColor("#2563EB"))
-    p.setColor(QPalette.HighlightedText, QColor("#FFFFFF"))
+    for role, hex_color in colors.items():
+        p.setColor(getattr(QPalette, role), QColor(hex_color))
     return p
 
 
-QSS_DARK = """
-QWidget { font-family: "Segoe UI"; font-size: 13px; }
-QLabel#Subtle { color: #AAB2BD; }
-QLabel#Header { font-size: 20px; font-weight: 800; color: #FFFFFF; }
-QLabel#Status { color: #DCDDDE; font-weight: 700; }
+# 팔레트는 테마별로 한 번만 만들어 재사용
+_PALETTE_CACHE: dict[str, QPalette] = {}
 
-QLineEdit, QPlainTextEdit, QComboBox {
-    background: #2F3136;
-    border: 1px solid #202225;
-    border-radius: 10px;
-    padding: 10px;
-    color: #DCDDDE;
-    selection-background-color: #5865F2;
-}
-QLineEdit:focus, QComboBox:focus { border: 1px solid #5865F2; }
-QComboBox::drop-down { border: 0px; width: 28px; }
-QComboBox::down-arrow {
-    image: none;
-    border-left: 6px solid transparent;
-    border-right: 6px solid transparent;
-    border-top: 8px solid #DCDDDE;
-    margin-right: 10px;
-}
 
-QGroupBox {
-    border: 1px solid #202225;
-    border-radius: 12px;
-    margin-top: 12px;
-}
-QGroupBox::title {
-    subcontrol-origin: margin;
-    subcontrol-position: top left;
-    padding: 0 6px;
-    color: #DCDDDE;
-    font-weight: 800;
-}
+def _cached_palette(name: str) -> QPalette:
+    p = _PALETTE_CACHE.get(name)
+    if p is None:
+        p = _PALETTE_CACHE[name] = _build_palette(THEME_COLORS[name])
+    return p
 
-QTableWidget {
-    background: #2F3136;
-    border: 1px solid #202225;
-    border-radius: 12px;
-    alternate-background-color: #2B2D31;
-}
-QHeaderView::section {
-    background: #202225;
-    color: #DCDDDE;
-    padding: 8px;
-    border: 0px;
-}
-QTableWidget::item { padding: 6px; }
-QTableWidget::item:selected { background: #3A3D44; }
-
-QPushButton {
-    background: #2F3136;
-    border: 1px solid #202225;
-    border-radius: 10px;
-    padding: 10px 12px;
-    font-weight: 800;
-    color: #DCDDDE;
-}
-QPushButton:hover { background: #34373C; border: 1px solid #1F2124; }
-QPushButton:pressed {
-    background: #232428;
-    border: 1px solid #5865F2;
-    padding-top: 12px;
-    padding-bottom: 8px;
-}
-QPushButton:disabled { background: #2B2D31; color: #7B8190; border: 1px solid #202225; }
-
-QPushButton#Primary { background: #5865F2; border: 1px solid #5865F2; color: #FFFFFF; }
-QPushButton#Primary:hover { background: #4E5AE6; border: 1px solid #4E5AE6; }
-QPushButton#Primary:pressed { background: #3C45B5; border: 1px solid #3C45B5; padding-top: 12px; padding-bottom: 8px; }
-
-QPushButton#Success { background: #3BA55C; border: 1px solid #3BA55C; color: #0B1A0F; }
-QPushButton#Success:hover { background: #339150; border: 1px solid #339150; }
-QPushButton#Success:pressed { background: #246A3A; border: 1px solid #246A3A; padding-top: 12px; padding-bottom: 8px; }
-
-QPushButton#Danger { background: #ED4245; border: 1px solid #ED4245; color: #1A0B0B; }
-QPushButton#Danger:hover { background: #D83C3E; border: 1px solid #D83C3E; }
-QPushButton#Danger:pressed { background: #A92E30; border: 1px solid #A92E30; padding-top: 12px; padding-bottom: 8px; }
-
-QProgressBar {
-    background: #202225;
-    border: 1px solid #202225;
-    border-radius: 10px;
-    height: 14px;
-    text-align: center;
-    color: #DCDDDE;
-}
-QProgressBar::chunk { background: #5865F2; border-radius: 10px; }
 
-QTabWidget::pane {
-    border: 1px solid #202225;
-    border-radius: 12px;
-    top: 0px;
-    background: #2F3136;
-}
-QTabBar::tab {
-    background: #2B2D31;
-    color: #DCDDDE;
-    border: 1px solid #202225;
-    border-bottom: 0px;
-    padding: 8px 12px;
-    border-top-left-radius: 10px;
-    border-top-right-radius: 10px;
-    margin-right: 6px;
-}
-QTabBar::tab:selected { background: #2F3136; }
-QTabBar::tab:hover { background: #34373C; }
-QCheckBox { color: #DCDDDE; }
-"""
-
-QSS_LIGHT = """
-QWidget { font-family: "Segoe UI"; font-size: 13px; }
-QLabel#Subtle { color: #6B7280; }
-QLabel#Header { font-size: 20px; font-weight: 800; color: #111827; }
-QLabel#Status { color: #111827; font-weight: 700; }
-
-QLineEdit, QPlainTextEdit, QComboBox {
-    background: #FFFFFF;
-    border: 1px solid #D1D5DB;
-    border-radius: 10px;
-    padding: 10px;
-    color: #111827;
-    selection-background-color: #2563EB;
-}
-QLineEdit:focus, QComboBox:focus { border: 1px solid #2563EB; }
-QComboBox::drop-down { border: 0px; width: 28px; }
-QComboBox::down-arrow {
-    image: none;
-    border-left: 6px solid transparent;
-    border-right: 6px solid transparent;
-    border-top: 8px solid #111827;
-    margin-right: 10px;
-}
+def palette_dark_discord() -> QPalette:
+    return _cached_palette("dark")
 
-QGroupBox {
-    border: 1px solid #D1D5DB;
-    border-radius: 12px;
-    margin-top: 12px;
-}
-QGroupBox::title {
-    subcontrol-origin: margin;
-    subcontrol-position: top left;
-    padding: 0 6px;
-    color: #111827;
-    font-weight: 800;
-}
 
-QTableWidget {
-    background: #FFFFFF;
-    border: 1px solid #D1D5DB;
-    border-radius: 12px;
-    alternate-background-color: #F3F4F6;
-}
-QHeaderView::section { background: #F3F4F6; color: #111827; padding: 8px; border: 0px; }
-QTableWidget::item { padding: 6px; }
-QTableWidget::item:selected { background: #DBEAFE; }
-
-QPushButton {
-    background: #E5E7EB;
-    border: 1px solid #D1D5DB;
-    border-radius: 10px;
-    padding: 10px 12px;
-    font-weight: 800;
-    color: #111827;
-}
-QPushButton:hover { background: #D1D5DB; }
-QPushButton:pressed {
-    background: #C7CDD6;
-    border: 1px solid #2563EB;
-    padding-top: 12px;
-    padding-bottom: 8px;
-}
-QPushButton:disabled { color: #9CA3AF; }
-
-QPushButton#Primary { background: #2563EB; border: 1px solid #2563EB; color: white; }
-QPushButton#Primary:hover { background: #1D4ED8; border: 1px solid #1D4ED8; }
-QPushButton#Primary:pressed { background: #1E40AF; border: 1px solid #1E40AF; padding-top: 12px; padding-bottom: 8px; }
-
-QPushButton#Success { background: #16A34A; border: 1px solid #16A34A; color: white; }
-QPushButton#Success:hover { background: #15803D; border: 1px solid #15803D; }
-QPushButton#Success:pressed { background: #166534; border: 1px solid #166534; padding-top: 12px; padding-bottom: 8px; }
-
-QPushButton#Danger { background: #DC2626; border: 1px solid #DC2626; color: white; }
-QPushButton#Danger:hover { background: #B91C1C; border: 1px solid #B91C1C; }
-QPushButton#Danger:pressed { background: #991B1B; border: 1px solid #991B1B; padding-top: 12px; padding-bottom: 8px; }
-
-QProgressBar {
-    background: #E5E7EB;
-    border: 1px solid #D1D5DB;
-    border-radius: 10px;
-    height: 14px;
-    text-align: center;
-}
-QProgressBar::chunk { background: #2563EB; border-radius: 10px; }
+def palette_light_clean() -> QPalette:
+    return _cached_palette("light")
 
-QTabWidget::pane {
-    border: 1px solid #D1D5DB;
-    border-radius: 12px;
-    top: 0px;
-    background: #FFFFFF;
-}
-QTabBar::tab {
-    background: #F3F4F6;
-    color: #111827;
-    border: 1px solid #D1D5DB;
-    border-bottom: 0px;
-    padding: 8px 12px;
-    border-top-left-radius: 10px;
-    border-top-right-radius: 10px;
-    margin-right: 6px;
-}
-QTabBar::tab:selected { background: #FFFFFF; }
-QTabBar::tab:hover { background: #E5E7EB; }
-"""
+
+@lru_cache(maxsize=None)
+def load_qss(name: str) -> str:
+    """
+    Qt 리소스(themes_rc)에 들어 있는 :/themes/<name>.qss 스타일시트를 읽음.
+    """
+    f = QFile(f":/themes/{name}.qss")
+    if not f.open(QIODevice.ReadOnly | QIODevice.Text):
+        return ""
+    try:
+        return bytes(f.readAll()).decode("utf-8")
+    finally:
+        f.close()
 
 
 # -------------------- Data --------------------
-@dataclass
+@dataclass(slots=True)
 class QueueItem:
     url: str
     title: str = ""
     status: str = "Queued"
+    # 필터용 소문자 제목. 확장 스레드에서 만들 때 한 번만 계산
+    title_lower: str = field(default="", repr=False)
+    is_shorts: bool = field(default=False, repr=False)
+
+    def __post_init__(self):
+        if not self.title_lower and self.title:
+            self.title_lower = self.title.lower()
+        self.is_shorts = is_shorts_url(self.url)
+
+
+class QueueStore:
+    """
+    대기열을 url/title/status 평행 리스트(SoA)로 보관. 행마다 객체를 만들지 않음.
+    titles_lower/shorts는 다운로드 필터용으로 미리 계산해 둔 소문자 제목과 쇼츠 여부.
+    """
+    COLUMNS = ("urls", "titles", "titles_lower", "shorts", "statuses")
+    __slots__ = COLUMNS
+
+    def __init__(self):
+        self.urls: list[str] = []
+        self.titles: list[str] = []
+        self.titles_lower: list[str] = []
+        self.shorts: list[bool] = []
+        self.statuses: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self.urls)
+
+    def add(self, url: str, title: str = "", status: str = "Queued"):
+        self.urls.append(url)
+        self.titles.append(title)
+        self.titles_lower.append(title.lower())
+        self.shorts.append(is_shorts_url(url))
+        self.statuses.append(status)
+
+    def extend(self, items: list[QueueItem], status: str = "Queued"):
+        n = len(self.urls)
+        for it in items:
+            self.urls.append(it.url)
+            self.titles.append(it.title)
+            self.titles_lower.append(it.title_lower)
+            self.shorts.append(it.is_shorts)
+        self.statuses.extend([status] * (len(self.urls) - n))
+
+    def remove_rows(self, rows: list[int]):
+        drop = set(rows)
+        keep = [i for i in range(len(self.urls)) if i not in drop]
+        for name in self.COLUMNS:
+            col = getattr(self, name)
+            setattr(self, name, [col[i] for i in keep])
+
+    def clear(self):
+        for name in self.COLUMNS:
+            getattr(self, name).clear()
+
+    def subset(self, rows: list[int]) -> "QueueStore":
+        sub = QueueStore()
+        for name in self.COLUMNS:
+            col = getattr(self, name)
+            setattr(sub, name, [col[i] for i in rows])
+        return sub
+
+
+class YdlPool:
+    """
+    같은 옵션의 YoutubeDL 인스턴스를 재사용하기 위한 풀.
+    인스턴스 하나는 동시에 한 스레드만 쓰도록 acquire/release로 빌려 쓰고 돌려줌.
+    """
+
+    def __init__(self, max_keys: int = 1):
+        self._lock = threading.Lock()
+        self._idle: dict[str, list] = {}
+        self._max_keys = max_keys
+
+    @staticmethod
+    def opts_key(opts: dict) -> str:
+        return repr(sorted(opts.items()))
+
+    def acquire(self, opts: dict):
+        key = self.opts_key(opts)
+        stale = []
+        ydl = None
+        with self._lock:
+            idle = self._idle.pop(key, None)
+            if idle is None:
+                idle = []
+                while len(self._idle) >= self._max_keys:
+                    stale.extend(self._idle.pop(next(iter(self._idle))))
+            if idle:
+                ydl = idle.pop()
+            self._idle[key] = idle
+        for old in stale:
+            self._close(old)
+        if ydl is None:
+            # YoutubeDL은 받은 dict를 그 자리에서 고치므로(color, js_runtimes 등) 키 계산 뒤 사본으로 생성
+            ydl = yt_dlp.YoutubeDL(dict(opts))
+        return key, ydl
+
+    def release(self, key: str, ydl, reuse: bool = True):
+        with self._lock:
+            idle = self._idle.get(key)
+            if reuse and idle is not None:
+                idle.append(ydl)
+                return
+        self._close(ydl)
+
+    def close_all(self):
+        with self._lock:
+            stale = [y for idle in self._idle.values() for y in idle]
+            self._idle.clear()
+        for y in stale:
+            self._close(y)
+
+    @staticmethod
+    def _close(ydl):
+        try:
+            ydl.close()
+        except Exception:
+            pass
+
+
+# -------------------- Queue table model --------------------
+class QueueModel(QAbstractTableModel):
+    """
+    self.queue(QueueStore)의 평행 리스트를 그대로 보여주는 테이블 모델. 셀 위젯 아이템을 만들지 않음.
+    """
+    HEADERS = ("✔", "제목", "상태")
+
+    def __init__(self, store: QueueStore, parent=None):
+        super().__init__(parent)
+        self._store = store
+        # 체크된 행 번호 집합(체크 해제된 행만 빠짐)
+        self._checked: set[int] = set()
+        self._rows = 0
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._rows
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if role == Qt.DisplayRole:
+            if col == 1:
+                return self._store.titles[row] or self._store.urls[row]
+            if col == 2:
+                return self._store.statuses[row] or "Queued"
+        elif role == Qt.CheckStateRole and col == 0:
+            return Qt.Checked if row in self._checked else Qt.Unchecked
+        return None
+
+    def flags(self, index):
+        f = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if index.column() == 0:
+            f |= Qt.ItemIsUserCheckable
+        return f
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role == Qt.CheckStateRole and index.isValid() and index.column() == 0:
+            if Qt.CheckState(value) == Qt.Checked:
+                self._checked.add(index.row())
+            else:
+                self._checked.discard(index.row())
+            self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+            return True
+        return False
+
+    # 대기열(QueueStore)이 바뀐 뒤 모델에 반영
+    def sync_appended(self):
+        n = len(self._store)
+        if n <= self._rows:
+            return
+        self.beginInsertRows(QModelIndex(), self._rows, n - 1)
+        self._checked.update(range(self._rows, n))
+        self._rows = n
+        self.endInsertRows()
+
+    def reset(self):
+        self.beginResetModel()
+        self._rows = len(self._store)
+        self._checked = set(range(self._rows))
+        self.endResetModel()
+
+    def clear(self):
+        self.beginResetModel()
+        self._store.clear()
+        self._rows = 0
+        self._checked.clear()
+        self.endResetModel()
+
+    def remove_rows(self, rows: list[int]):
+        """
+        대기열에서 행을 지우고 모델에 반영. 연속 구간이면 beginRemoveRows, 아니면 한 번의 reset.
+        남은 행은 기존처럼 모두 체크 상태로 둠.
+        """
+        if not rows:
+            return
+        lo, hi = rows[0], rows[-1]
+        contiguous = (hi - lo + 1 == len(rows)) and (self._rows == len(self._store))
+        if not contiguous:
+            self.beginResetModel()
+            self._store.remove_rows(rows)
+            self._rows = len(self._store)
+            self._checked = set(range(self._rows))
+            self.endResetModel()
+            return
+
+        self.beginRemoveRows(QModelIndex(), lo, hi)
+        self._store.remove_rows(rows)
+        self._rows = len(self._store)
+        self._checked = set(range(self._rows))
+        self.endRemoveRows()
+        if self._rows:
+            self.dataChanged.emit(self.index(0, 0), self.index(self._rows - 1, 0), [Qt.CheckStateRole])
+
+    def checked_rows(self) -> list[int]:
+        # 기본값(전체 체크)이면 정렬 없이 바로 반환
+        if len(self._checked) == self._rows:
+            return list(range(self._rows))
+        return sorted(self._checked)
+
+    def status_changed(self, row: int):
+        if 0 <= row < self._rows:
+            idx = self.index(row, 2)
+            self.dataChanged.emit(idx, idx, [Qt.DisplayRole])
+
+
+# -------------------- Expand worker (persistent thread + job pool) --------------------
+EXPAND_POOL_SIZE = 4
+EXPAND_OPTS = {
+    "video": {"quiet": True, "ignoreerrors": True, "skip_download": True},
+    # 채널도 in_playlist 유지: extract_flat=True면 리디렉트/라이브 등 최상위 url 결과가 풀리지 않음
+    "channel": {"quiet": True, "ignoreerrors": True, "extract_flat": "in_playlist", "skip_download": True},
+    "playlist": {"quiet": True, "ignoreerrors": True, "extract_flat": "in_playlist", "skip_download": True},
+}
+# yt-dlp 파싱은 GIL에 묶이므로 실제 추출은 별도 프로세스에서 실행
+EXPAND_PROC_COUNT = max(1, (os.cpu_count() or 2) // 2)
+EXPAND_POLL_INTERVAL = 0.2
+
+# URL마다 YoutubeDL을 새로 만들지 않고 재사용(쿠키/JS 설정이 바뀌면 새 인스턴스). 프로세스마다 하나씩 생김
+_EXPAND_YDL_POOL = YdlPool(max_keys=len(EXPAND_OPTS))
+
+
+def _expand_extract(url: str, ydl_opts: dict, process: bool):
+    """
+    확장 프로세스에서 실행되는 추출 함수. 프로세스 경계를 넘는 값은 slim_flat_info 결과(기본 타입)뿐.
+    """
+    pool_key, ydl = _EXPAND_YDL_POOL.acquire(ydl_opts)
+    ok = False
+    try:
+        info = ydl.extract_info(url, download=False, process=process)
+        ok = True
+    finally:
+        _EXPAND_YDL_POOL.release(pool_key, ydl, reuse=ok)
+    return slim_flat_info(info) if info else info
+
+
+class _SpawnTracker(type(multiprocessing.get_context("spawn"))):
+    """
+    spawn 컨텍스트 + 만든 자식 프로세스 목록(실행기 내부 _processes에 기대지 않고 직접 종료하기 위함).
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.children: list = []
+
+    def Process(self, *args, **kwargs):
+        p = super().Process(*args, **kwargs)
+        self.children.append(p)
+        return p
+
+
+class ExpandProcessPool(ProcessPoolExecutor):
+    """
+    확장용 프로세스 풀. Qt 스레드가 도는 프로세스를 fork하지 않도록 spawn 고정(Windows와 동일).
+    """
+
+    def __init__(self, max_workers: int):
+        ctx = _SpawnTracker()
+        super().__init__(max_workers=max_workers, mp_context=ctx)
+        self.children = ctx.children
+
+    def kill(self):
+        # 응답 없는 추출 때문에 앱 종료가 막히지 않도록 남은 프로세스는 강제 종료
+        self.shutdown(wait=False, cancel_futures=True)
+        for p in self.children:
+            try:
+                p.terminate()
+            except Exception:
+                pass
+
+
+class ExpandJob(QRunnable):
+    """
+    URL 하나를 확장하는 작업 단위. QRunnable은 시그널을 직접 못 보내므로 결과는 ExpandWorker를 통해 전달.
+    """
+
+    def __init__(self, url: str, worker: "ExpandWorker", gen: int):
+        super().__init__()
+        self.url = url
+        self.worker = worker
+        self.gen = gen
+
+    def run(self):
+        try:
+            if not self.worker._is_stale(self.gen):
+                self.worker._expand(self.url, self.gen)
+        finally:
+            self.worker.job_done.emit()
 
 
-# -------------------- Expand worker (persistent thread) --------------------
 class ExpandWorker(QObject):
     log = Signal(str)
     count = Signal(int)
-    finished_one = Signal(bool, str, list)  # ok, msg, list[QueueItem]
+    finished_one = Signal(int, str, bool, str, list)  # gen, src_url, ok, msg, list[QueueItem]
     idle = Signal()
-    request = Signal(str)
+    request = Signal(int, str)  # gen, url
+    request_batch = Signal(int, list)  # gen, list[str], 여러 URL을 이벤트 하나로 전달
+    job_done = Signal()
 
     set_cookiesfrombrowser = Signal(object)  # tuple|None
     set_js_runtimes = Signal(object)  # dict[str, dict] | None
 
-    def __init__(self):
+    def __init__(self, pool: QThreadPool):
         super().__init__()
-        self._stop = False
+        self._pool = pool
+        # 중지할 때마다 세대(gen)를 올림. 이전 세대의 요청/작업/결과는 버려짐
+        self._gen = 0
+        self._lock = threading.Lock()  # _gen, _queue (stop은 GUI 스레드에서 직접 호출됨)
         self._queue = deque()
         self._working = False
+        self._active = 0
 
         self.cookiesfrombrowser = None
         self.js_runtimes = None
 
+        self._proc_pool: ExpandProcessPool | None = None
+        self._proc_lock = threading.Lock()
+
         self.set_cookiesfrombrowser.connect(self._on_set_cookiesfrombrowser)
         self.set_js_runtimes.connect(self._on_set_js_runtimes)
         self.request.connect(self.enqueue)
+        self.request_batch.connect(self.enqueue_batch)
+        self.job_done.connect(self._on_job_done)
 
     @Slot(object)
     def _on_set_cookiesfrombrowser(self, cookies):
@@ -457,92 +908,180 @@ class ExpandWorker(QObject):
         self.js_runtimes = runtimes
 
     @Slot()
-    def stop(self):
-        self._stop = True
-        self._queue.clear()
+    def stop(self) -> int:
+        """
+        진행 중인 확장을 모두 버리고 새 세대 번호를 돌려줌(GUI는 이 번호로 요청을 보내고 결과를 거름).
+        """
+        with self._lock:
+            self._gen += 1
+            self._queue.clear()
+            return self._gen
+
+    def _is_stale(self, gen: int) -> bool:
+        return gen != self._gen
+
+    def close(self):
+        """
+        종료 시 확장 프로세스와 재사용 중이던 YoutubeDL 인스턴스 정리(작업 풀이 끝난 뒤 호출).
+        """
+        with self._proc_lock:
+            pp, self._proc_pool = self._proc_pool, None
+        if pp is not None:
+            pp.kill()
+        _EXPAND_YDL_POOL.close_all()
+
+    def _get_proc_pool(self) -> ExpandProcessPool:
+        with self._proc_lock:
+            if self._proc_pool is None:
+                self._proc_pool = ExpandProcessPool(EXPAND_PROC_COUNT)
+            return self._proc_pool
+
+    def _drop_proc_pool(self, pp: ExpandProcessPool):
+        # 다른 작업이 이미 새 풀로 바꿨으면 그대로 둠
+        with self._proc_lock:
+            if self._proc_pool is not pp:
+                return
+            self._proc_pool = None
+        pp.kill()
 
-    @Slot(str)
-    def enqueue(self, url: str):
+    @Slot(int, str)
+    def enqueue(self, gen: int, url: str):
         url = normalize_url(url)
         if not url:
             return
-        self._queue.append(url)
+        with self._lock:
+            if self._is_stale(gen):
+                return
+            self._queue.append(url)
+        if not self._working:
+            self._working = True
+            QTimer.singleShot(0, self._process_next)
+
+    @Slot(int, list)
+    def enqueue_batch(self, gen: int, urls: list):
+        batch = [u for u in map(normalize_url, urls) if u]
+        if not batch:
+            return
+        with self._lock:
+            if self._is_stale(gen):
+                return
+            self._queue.extend(batch)
         if not self._working:
             self._working = True
             QTimer.singleShot(0, self._process_next)
 
     @Slot()
     def _process_next(self):
-        if self._stop:
-            self._working = False
-            self.idle.emit()
+        # 한 번의 타이머 틱에서 쌓인 URL을 모두 꺼내 풀에 넘김
+        self._working = False
+        with self._lock:
+            batch = list(self._queue)
+            self._queue.clear()
+            gen = self._gen
+        if not batch:
+            if self._active == 0:
+                self.idle.emit()
             return
-        if not self._queue:
-            self._working = False
+
+        self._active += len(batch)
+        for url in batch:
+            self._pool.start(ExpandJob(url, self, gen))
+
+    @Slot()
+    def _on_job_done(self):
+        self._active = max(0, self._active - 1)
+        if self._active == 0 and not self._working:
             self.idle.emit()
-            return
 
-        url = self._queue.popleft()
-        self._expand(url)
-        QTimer.singleShot(0, self._process_next)
+    def _extract_flat(self, url: str, gen: int):
+        # 쿠키 설정에 따라 보이는 목록(비공개/연령 제한 등)이 달라지므로 키에 포함
+        key = ("flat", normalize_url(url), self.cookiesfrombrowser)
+        cache = _expand_cache()
+        hit = cache.get(key)
+        if hit is not None:
+            return hit
 
-    def _extract_flat(self, url: str):
-        ydl_opts = {
-            "quiet": True,
-            "ignoreerrors": True,
-            "extract_flat": "in_playlist",
-            "skip_download": True,
-        }
+        # URL 종류별로 옵션을 고정해 두면 종류마다 YoutubeDL 인스턴스 하나씩 재사용됨
+        kind = url_kind(key[1])
+        ydl_opts = dict(EXPAND_OPTS[kind])
 
         if self.cookiesfrombrowser:
             ydl_opts["cookiesfrombrowser"] = self.cookiesfrombrowser
         if self.js_runtimes:
             ydl_opts["js_runtimes"] = self.js_runtimes
 
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            return ydl.extract_info(url, download=False)
-
-    def _expand(self, url: str):
-        self._stop = False
+        # 자식 프로세스가 비정상 종료되면 풀 전체가 깨지므로 새 풀로 한 번만 다시 시도
+        for retry in (False, True):
+            pp = self._get_proc_pool()
+            try:
+                # 단일 영상은 제목만 필요하므로 포맷 선택 등 후처리 생략
+                fut = pp.submit(_expand_extract, url, ydl_opts, kind != "video")
+                while True:
+                    try:
+                        info = fut.result(timeout=EXPAND_POLL_INTERVAL)
+                        break
+                    except FuturesTimeout:
+                        # 중지 요청 시 결과를 기다리지 않음(실행 중인 추출은 프로세스에서 끝나고 버려짐)
+                        if self._is_stale(gen):
+                            fut.cancel()
+                            return None
+                break
+            except BrokenProcessPool:
+                self._drop_proc_pool(pp)
+                # 중지/종료(close) 중이면 새 풀을 만들지 않음
+                if self._is_stale(gen):
+                    return None
+                if retry:
+                    raise
+
+        if info:
+            cache.set(key, info, expire=EXPAND_CACHE_TTL)
+        return info
+
+    def _finish(self, gen: int, url: str, ok: bool, msg: str, collected: list):
+        # 중지 이후에 끝난 작업의 결과는 내보내지 않음
+        if not self._is_stale(gen):
+            self.finished_one.emit(gen, url, ok, msg, collected)
+
+    def _expand(self, url: str, gen: int):
         self.count.emit(0)
         self.log.emit(f"확장 시작: {url}")
 
         try:
-            info = self._extract_flat(url)
+            info = self._extract_flat(url, gen)
         except Exception as e:
-            self.finished_one.emit(False, f"분석 실패: {e}", [])
+            self._finish(gen, url, False, f"분석 실패: {e}", [])
             return
 
         if not info:
-            self.finished_one.emit(False, "정보를 가져오지 못했습니다.", [])
+            self._finish(gen, url, False, "정보를 가져오지 못했습니다.", [])
             return
 
-        entries = []
-        if isinstance(info, dict) and info.get("entries"):
-            entries = [e for e in info["entries"] if e]
+        # 앞쪽 몇 개만 보고 탭 엔트리 여부를 판단하고, 나머지는 이터레이터로 한 번만 순회
+        head, rest = split_entries_head(info, TAB_PROBE_COUNT)
 
-        if entries and all(looks_like_tab_entry(e) for e in entries):
+        if head and all(looks_like_tab_entry(e) for e in head):
             self.log.emit("탭 엔트리만 감지됨 → /videos로 재시도")
             retry_url = normalize_channel_to_videos(url)
             if retry_url != url:
                 try:
-                    info2 = self._extract_flat(retry_url)
-                    if isinstance(info2, dict) and info2.get("entries"):
-                        entries2 = [e for e in info2["entries"] if e]
-                        if entries2 and not all(looks_like_tab_entry(e) for e in entries2):
-                            entries = entries2
-                            self.log.emit(f"재시도 성공: {retry_url}")
-                        else:
-                            self.log.emit("videos 재시도에서도 탭/빈 결과 → 원래 결과 유지")
+                    info2 = self._extract_flat(retry_url, gen)
+                    head2, rest2 = split_entries_head(info2, TAB_PROBE_COUNT)
+                    if head2 and not all(looks_like_tab_entry(e) for e in head2):
+                        head, rest = head2, rest2
+                        self.log.emit(f"재시도 성공: {retry_url}")
+                    else:
+                        self.log.emit("videos 재시도에서도 탭/빈 결과 → 원래 결과 유지")
                 except Exception as e:
                     self.log.emit(f"videos 재시도 실패: {e}")
 
         collected: list[QueueItem] = []
-        if entries:
+        if head:
             n = 0
-            for e in entries:
-                if self._stop:
-                    self.finished_one.emit(False, f"사용자 취소(수집 {n}개)", collected)
+            for e in chain(head, rest):
+                if not e:
+                    continue
+                if self._is_stale(gen):
                     return
 
                 u = e.get("url") or e.get("webpage_url") or ""
@@ -554,17 +1093,50 @@ class ExpandWorker(QObject):
                         self.count.emit(n)
 
             self.count.emit(n)
-            self.finished_one.emit(True, f"추가 완료({n}개)", collected)
+            self._finish(gen, url, True, f"추가 완료({n}개)", collected)
             return
 
         title = info.get("title") if isinstance(info, dict) else None
         title = title or url
         collected.append(QueueItem(url=url, title=title, status="Queued"))
         self.count.emit(1)
-        self.finished_one.emit(True, "추가 완료(1개)", collected)
+        self._finish(gen, url, True, "추가 완료(1개)", collected)
 
 
 # -------------------- Download worker --------------------
+HOOK_EMIT_INTERVAL = 0.08
+
+# 옵션이 같으면 다운로드 실행 간에도 YoutubeDL 인스턴스를 재사용.
+# 진행률 훅은 인스턴스에 고정되므로 인스턴스마다 슬롯 하나를 등록하고, 빌려 간 항목의 훅으로 전달.
+# (조각 다운로드 훅은 yt-dlp 내부 스레드에서 불리므로 스레드 기준으로 찾으면 안 됨)
+_DL_YDL_POOL = YdlPool(max_keys=1)
+
+
+class _HookSlot:
+    __slots__ = ("hook",)
+
+    def __init__(self):
+        self.hook = None
+
+    def __call__(self, d: dict):
+        hook = self.hook
+        if hook is not None:
+            hook(d)
+
+
+_DL_HOOK_SLOTS: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_DL_HOOK_LOCK = threading.Lock()
+
+
+def _dl_hook_slot(ydl) -> _HookSlot:
+    with _DL_HOOK_LOCK:
+        slot = _DL_HOOK_SLOTS.get(ydl)
+        if slot is None:
+            slot = _DL_HOOK_SLOTS[ydl] = _HookSlot()
+            ydl.add_progress_hook(slot)
+    return slot
+
+
 class DownloadWorker(QObject):
     log = Signal(str)
     current_title = Signal(str)
@@ -572,11 +1144,12 @@ class DownloadWorker(QObject):
     total_progress = Signal(int)
     file_eta = Signal(str)
     total_eta = Signal(str)
+    item_status = Signal(int, str, str)  # 대기열 행, url, 상태
     finished = Signal(bool, str)
 
     def __init__(
         self,
-        items: list[QueueItem],
+        items: QueueStore,
         save_folder: str,
         keep_thumb: bool,
         keep_sub: bool,
@@ -585,7 +1158,10 @@ class DownloadWorker(QObject):
         format_sort: list[str] | None,
         cookiesfrombrowser: tuple | None,
         js_runtimes: dict[str, dict] | None,
-        filter_opts: dict
+        filter_opts: dict,
+        concurrent_fragments: int = 4,
+        parallel_videos: int = 1,
+        rows: list[int] | None = None
     ):
         super().__init__()
         self.items = items
@@ -598,74 +1174,188 @@ class DownloadWorker(QObject):
         self.cookiesfrombrowser = cookiesfrombrowser
         self.js_runtimes = js_runtimes
         self.filter_opts = filter_opts
+        self.concurrent_fragments = max(1, int(concurrent_fragments or 1))
+        self.parallel_videos = max(1, int(parallel_videos or 1))
+        self.rows = rows if rows is not None else list(range(len(items)))
 
         self._stop = False
         self._start = 0.0
         self._total = 0
         self._done = 0
 
-    def stop(self):
-        self._stop = True
+        self._lock = threading.Lock()
+        self._active: set[int] = set()
+        self._ydl_opts: dict = {}
+        self._log_fd: int | None = None
+        self._any_fail = False
+        self._last_error = ""
 
-    @Slot()
-    def run(self):
-        if not self.items:
-            self.finished.emit(False, "대기열이 비어있습니다.")
-            return
+        self._last_emit = 0.0
+        self._last_pct_str: str | None = None
+        self._last_eta_str: str | None = None
+        self._last_title: str | None = None
 
-        self._start = time.time()
-        self._total = len(self.items)
-        self._done = 0
-
-        outtmpl = os.path.join(self.save_folder, "%(title)s.%(ext)s")
-        ffloc = ffmpeg_location()
+    def stop(self):
+        self._stop = True
 
-        any_fail = False
-        last_error = ""
+    def _write_log(self, msg: str):
+        if self._log_fd is not None:
+            _log_write(self._log_fd, msg + "\n")
 
+    def _make_hook(self, idx: int):
         def hook(d: dict):
             if self._stop:
                 return
             st = d.get("status")
             if st == "downloading":
-                percent = None
-                p_str = strip_ansi(d.get("_percent_str", "")).replace("%", "").strip()
-                if p_str:
-                    try:
-                        percent = int(float(p_str))
-                    except Exception:
-                        percent = None
-
-                if percent is None:
+                # 진행률 시그널은 일정 간격(약 12Hz)으로만 보냄. 마지막 틱과 finished 등 다른 상태는 항상 통과
+                now = time.monotonic()
+                if now - self._last_emit < HOOK_EMIT_INTERVAL:
                     total = d.get("total_bytes") or d.get("total_bytes_estimate")
-                    downloaded = d.get("downloaded_bytes")
-                    if total and downloaded is not None:
+                    if not total or (d.get("downloaded_bytes") or 0) < total:
+                        return
+
+                # 동시에 여러 항목을 받을 때 파일 진행률은 가장 앞선(인덱스가 작은) 항목만 표시
+                with self._lock:
+                    lead = min(self._active) if self._active else idx
+                if idx != lead:
+                    return
+                self._last_emit = now
+
+                start, done, total_n = self._start, self._done, self._total
+
+                p_raw = d.get("_percent_str") or ""
+                if not p_raw or p_raw != self._last_pct_str:
+                    self._last_pct_str = p_raw
+                    percent = None
+                    p_str = strip_ansi(p_raw).replace("%", "").strip()
+                    if p_str:
                         try:
-                            percent = int((downloaded / total) * 100)
+                            percent = int(float(p_str))
                         except Exception:
+                            percent = None
+
+                    if percent is None:
+                        total = d.get("total_bytes") or d.get("total_bytes_estimate")
+                        downloaded = d.get("downloaded_bytes")
+                        if total and downloaded is not None:
+                            try:
+                                percent = int((downloaded / total) * 100)
+                            except Exception:
+                                percent = 0
+                        else:
                             percent = 0
-                    else:
-                        percent = 0
+
+                    self.file_progress.emit(max(0, min(100, percent)))
 
                 eta = d.get("eta")
                 if eta is None:
-                    eta_str = strip_ansi(d.get("_eta_str", "--:--")).strip()
+                    eta_str = strip_ansi(d.get("_eta_str") or "--:--").strip()
                 else:
                     eta_str = hms(int(eta))
+                if eta_str != self._last_eta_str:
+                    self._last_eta_str = eta_str
+                    self.file_eta.emit(eta_str)
 
-                self.file_progress.emit(max(0, min(100, percent)))
-                self.file_eta.emit(eta_str)
-
-                elapsed = time.time() - self._start
-                if self._done > 0:
-                    avg = elapsed / self._done
-                    rem = self._total - self._done
-                    self.total_eta.emit(hms(int(avg * rem)))
+                if done > 0:
+                    avg = (time.time() - start) / done
+                    self.total_eta.emit(hms(int(avg * (total_n - done))))
                 else:
                     self.total_eta.emit("계산 중...")
             elif st == "finished":
+                with self._lock:
+                    lead = min(self._active) if self._active else idx
+                if idx == lead:
+                    self._last_pct_str = "100%"
+                    self.file_progress.emit(100)
                 self.log.emit("병합 중...")
 
+        return hook
+
+    def _emit_total_eta(self):
+        elapsed = time.time() - self._start
+        done = self._done
+        if done > 0:
+            avg = elapsed / done
+            rem = self._total - done
+            self.total_eta.emit(hms(int(avg * rem)))
+        else:
+            self.total_eta.emit("계산 중...")
+
+    def _download_one(self, idx: int):
+        if self._stop:
+            return
+
+        url = self.items.urls[idx]
+        title = self.items.titles[idx] or url
+        if title != self._last_title:
+            self._last_title = title
+            self.current_title.emit(title)
+
+        msg = f"[{idx + 1}/{self._total}] {title}"
+        self.log.emit(msg)
+        self._write_log(msg)
+
+        with self._lock:
+            self._active.add(idx)
+            is_lead = idx == min(self._active)
+        if is_lead:
+            self._last_pct_str = None
+            self._last_eta_str = None
+            self.file_progress.emit(0)
+            self.file_eta.emit("--:--")
+
+        self.item_status.emit(self.rows[idx], url, "Downloading")
+
+        # YoutubeDL 인스턴스는 스레드 간 공유하지 않음(풀에서 빌려 쓰고 반납)
+        pool_key, ydl = _DL_YDL_POOL.acquire(self._ydl_opts)
+        hook_slot = _dl_hook_slot(ydl)
+        hook_slot.hook = self._make_hook(idx)
+        ok = False
+        try:
+            # yt-dlp는 오류 후 _download_retcode를 되돌리지 않으므로 재사용 인스턴스는 매번 초기화
+            ydl._download_retcode = 0
+            ret = ydl.download([url])
+            ok = not ret
+            self.item_status.emit(self.rows[idx], url, "Done" if ok else "Failed")
+            if not ok:
+                with self._lock:
+                    self._any_fail = True
+        except Exception as e:
+            self.item_status.emit(self.rows[idx], url, "Failed")
+            emsg = f"실패: {title} ({e})"
+            self.log.emit(emsg)
+            self._write_log(emsg)
+            with self._lock:
+                self._any_fail = True
+                self._last_error = str(e) or self._last_error
+        finally:
+            hook_slot.hook = None
+            _DL_YDL_POOL.release(pool_key, ydl, reuse=ok)
+            with self._lock:
+                self._active.discard(idx)
+                self._done += 1
+                done = self._done
+            self.total_progress.emit(int((done / self._total) * 100))
+            self._emit_total_eta()
+
+    @Slot()
+    def run(self):
+        if not self.items:
+            self.finished.emit(False, "대기열이 비어있습니다.")
+            return
+
+        self._start = time.time()
+        self._total = len(self.items)
+        self._done = 0
+        self._active.clear()
+        self._any_fail = False
+        self._last_error = ""
+
+        outtmpl = os.path.join(self.save_folder, "%(title)s.%(ext)s")
+        ffloc = ffmpeg_location()
+        aria2c = aria2c_location()
+
         ydl_opts = {
             "format": self.fmt,
             "merge_output_format": "mkv",
@@ -673,9 +1363,9 @@ class DownloadWorker(QObject):
             "ignoreerrors": True,
             "quiet": True,
             "no_warnings": True,
-            "progress_hooks": [hook],
             "writethumbnail": bool(self.keep_thumb),
             "writesubtitles": bool(self.keep_sub),
+            "concurrent_fragment_downloads": self.concurrent_fragments,
         }
 
         if self.format_sort:
@@ -693,54 +1383,47 @@ class DownloadWorker(QObject):
         if ffloc:
             ydl_opts["ffmpeg_location"] = ffloc
 
-        f = None
+        if aria2c:
+            ydl_opts["external_downloader"] = {"default": aria2c}
+            ydl_opts["external_downloader_args"] = {"aria2c": ["-x", "8", "-s", "8", "-k", "1M"]}
+
+        self._ydl_opts = ydl_opts
+
+        fd = None
         try:
             if self.log_path:
                 os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
-                f = open(self.log_path, "a", encoding="utf-8")
-                f.write(f"\n--- Session {time.strftime('%Y-%m-%d %H:%M:%S')} ---\n")
-                f.write(f"format={self.fmt}\n")
+                fd = _log_open(self.log_path)
+                lines = [
+                    f"\n--- Session {time.strftime('%Y-%m-%d %H:%M:%S')} ---",
+                    f"format={self.fmt}",
+                    f"concurrent_fragments={self.concurrent_fragments}",
+                    f"parallel_videos={self.parallel_videos}",
+                ]
+                if aria2c:
+                    lines.append(f"external_downloader={aria2c}")
                 if self.format_sort:
-                    f.write(f"format_sort={self.format_sort}\n")
+                    lines.append(f"format_sort={self.format_sort}")
                 if self.cookiesfrombrowser:
-                    f.write(f"cookiesfrombrowser={self.cookiesfrombrowser}\n")
+                    lines.append(f"cookiesfrombrowser={self.cookiesfrombrowser}")
                 if self.js_runtimes:
-                    f.write(f"js_runtimes={self.js_runtimes}\n")
+                    lines.append(f"js_runtimes={self.js_runtimes}")
                 if self.filter_opts:
-                    f.write(f"filter_opts={self.filter_opts}\n")
-
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                for idx, item in enumerate(self.items):
-                    if self._stop:
-                        self.finished.emit(False, "사용자 중지")
-                        return
-
-                    title = item.title or item.url
-                    self.current_title.emit(title)
+                    lines.append(f"filter_opts={self.filter_opts}")
+                _log_write(fd, "\n".join(lines) + "\n")
+            self._log_fd = fd
 
-                    msg = f"[{idx + 1}/{self._total}] {title}"
-                    self.log.emit(msg)
-                    if f:
-                        f.write(msg + "\n")
+            with ThreadPoolExecutor(max_workers=self.parallel_videos) as ex:
+                futures = [ex.submit(self._download_one, idx) for idx in range(len(self.items))]
+                for fut in as_completed(futures):
+                    fut.result()
 
-                    self.file_progress.emit(0)
-                    self.file_eta.emit("--:--")
+            if self._stop:
+                self.finished.emit(False, "사용자 중지")
+                return
 
-                    try:
-                        ydl.download([item.url])
-                    except Exception as e:
-                        any_fail = True
-                        last_error = str(e) or last_error
-                        emsg = f"실패: {title} ({e})"
-                        self.log.emit(emsg)
-                        if f:
-                            f.write(emsg + "\n")
-
-                    self._done += 1
-                    self.total_progress.emit(int((self._done / self._total) * 100))
-
-            if any_fail:
-                extra = f" / 마지막 오류: {last_error}" if last_error else ""
+            if self._any_fail:
+                extra = f" / 마지막 오류: {self._last_error}" if self._last_error else ""
                 self.finished.emit(False, f"일부 항목 다운로드 실패{extra}")
             else:
                 self.file_progress.emit(100)
@@ -749,11 +1432,62 @@ class DownloadWorker(QObject):
                 self.finished.emit(True, "완료")
 
         finally:
-            if f:
-                f.close()
+            self._log_fd = None
+            if fd is not None:
+                _log_close(fd)
+
+
+# -------------------- Settings --------------------
+SETTINGS_FLUSH_MS = 500
+
+
+class ThrottledSettings(QObject):
+    """
+    QSettings 쓰기 묶음 처리. setValue는 dict에 모아 두고 타이머/종료 시 한 번에 기록 후 sync.
+    읽기는 아직 기록 안 된 값을 먼저 보고 나머지는 QSettings에 위임.
+    """
+
+    def __init__(self, org: str, app: str, parent=None):
+        super().__init__(parent)
+        self._qs = QSettings(org, app)
+        self._pending: dict[str, object] = {}
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(SETTINGS_FLUSH_MS)
+        self._timer.timeout.connect(self.flush)
+
+    def setValue(self, key: str, value):
+        self._pending[key] = value
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def value(self, key: str, default=None):
+        if key in self._pending:
+            return self._pending[key]
+        return self._qs.value(key, default)
+
+    def allKeys(self) -> list[str]:
+        keys = self._qs.allKeys()
+        return keys + [k for k in self._pending if k not in keys]
+
+    @Slot()
+    def flush(self):
+        self._timer.stop()
+        if self._pending:
+            for k, v in self._pending.items():
+                self._qs.setValue(k, v)
+            self._pending.clear()
+        self._qs.sync()
+
+    def sync(self):
+        self.flush()
 
 
 # -------------------- Main Window --------------------
+LOG_VIEW_FLUSH_MS = 100
+FILTER_COMMIT_MS = 300
+
+
 class MainWindow(QMainWindow):
     ORG = "LocalLab"
     APP = "YTQueueUltimateFullPlusTabs"
@@ -764,40 +1498,51 @@ class MainWindow(QMainWindow):
         self.resize(1380, 920)
         self.setAcceptDrops(True)
 
-        self.settings = QSettings(self.ORG, self.APP)
+        self.settings = ThrottledSettings(self.ORG, self.APP, self)
+        QApplication.instance().aboutToQuit.connect(self.settings.flush)
+        # 설정은 시작 시 한 번에 읽어 두고 dict에서 조회(키마다 레지스트리/INI 접근 방지)
+        self._cfg_cache = {k: self.settings.value(k) for k in self.settings.allKeys()}
 
         default_download_folder = str(Path.home() / "Downloads")
-        self.save_folder = self.settings.value("save_folder", default_download_folder, str)
+        self.save_folder = self._cfg("save_folder", default_download_folder, str)
 
-        self.theme_mode = self.settings.value("theme_mode", "dark", str)
-        self.keep_thumb = self.settings.value("keep_thumb", False, bool)
-        self.keep_sub = self.settings.value("keep_sub", False, bool)
-        self.log_to_file = self.settings.value("log_to_file", False, bool)
-        self.force_best = self.settings.value("force_best", True, bool)
-        self.max_quality = self.settings.value("max_quality", "1080p", str)
+        self.theme_mode = self._cfg("theme_mode", "dark", str)
+        self._theme_applied = False
+        self.keep_thumb = self._cfg("keep_thumb", False, bool)
+        self.keep_sub = self._cfg("keep_sub", False, bool)
+        self.log_to_file = self._cfg("log_to_file", False, bool)
+        self.force_best = self._cfg("force_best", True, bool)
+        self.max_quality = self._cfg("max_quality", "1080p", str)
 
         # 기본은 OFF
-        self.use_cookies = self.settings.value("use_cookies", False, bool)
-        self.cookie_browser = self.settings.value("cookie_browser", "chrome", str)
-
-        self.filter_exclude_shorts = self.settings.value("filter_exclude_shorts", False, bool)
-        self.filter_date_after = self.settings.value("filter_date_after", "", str)
-        self.filter_date_before = self.settings.value("filter_date_before", "", str)
-        self.filter_include_kw = self.settings.value("filter_include_kw", "", str)
-        self.filter_exclude_kw = self.settings.value("filter_exclude_kw", "", str)
-
-        self.codec_pref = self.settings.value("codec_pref", "auto", str)
+        self.use_cookies = self._cfg("use_cookies", False, bool)
+        self.cookie_browser = self._cfg("cookie_browser", "chrome", str)
+
+        self.filter_exclude_shorts = self._cfg("filter_exclude_shorts", False, bool)
+        self.filter_date_after = self._cfg("filter_date_after", "", str)
+        self.filter_date_before = self._cfg("filter_date_before", "", str)
+        self.filter_include_kw = self._cfg("filter_include_kw", "", str)
+        self.filter_exclude_kw = self._cfg("filter_exclude_kw", "", str)
+        self._filter_include_kw_lower = self.filter_include_kw.lower()
+        self._filter_exclude_kw_lower = self.filter_exclude_kw.lower()
+
+        self.codec_pref = self._cfg("codec_pref", "auto", str)
+        self._fmt_cache: tuple[tuple, str] | None = None
+        self.concurrent_fragments = self._cfg("concurrent_fragments", 4, int)
+        self.parallel_videos = self._cfg("parallel_videos", 1, int)
 
         self.js_runtimes = detect_js_runtimes()
 
-        self.queue: list[QueueItem] = []
-        self.url_set: set[str] = set()
+        self.queue = QueueStore()
+        # URL 해시(xxh64) → 대기열 행 번호. 중복 검사와 상태 갱신 시 행 찾기에 사용
+        # URL 문자열 원본은 QueueStore에만 보관
+        self.url_index: dict[int, int] = {}
 
         self._pending_count = 0
+        self._expand_gen = 0  # ExpandWorker.stop()이 올려 주는 확장 세대 번호
         self._expanding_collected_count = 0
 
-        # 확장 요청 URL 추적(확장 실패 시 재시도용)
-        self._pending_urls = deque()
+        # 확장 실패 시 재시도용(한 URL당 1회)
         self._expand_retry_once: set[str] = set()
 
         self.worker_thread: QThread | None = None
@@ -808,15 +1553,36 @@ class MainWindow(QMainWindow):
         self._retry_with_cookies_requested = False
         self._last_fail_message = ""
 
+        # 로그/상태 갱신은 모아서 한 번에 반영(확장 결과가 몰릴 때 위젯 갱신 횟수 감소)
+        self._log_buffer: list[str] = []
+        # 창이 최소화/숨김 상태일 때 미뤄 둔 라벨 텍스트
+        self._deferred_labels: dict[QLabel, str] = {}
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(LOG_VIEW_FLUSH_MS)
+        self._log_timer.timeout.connect(self._flush_log)
+        self._state_timer = QTimer(self)
+        self._state_timer.setSingleShot(True)
+        self._state_timer.setInterval(0)
+        self._state_timer.timeout.connect(self._refresh_state_now)
+        self._last_enable_state: tuple[bool, bool] | None = None
+        # 필터 입력은 타이핑이 멈춘 뒤 한 번만 설정에 기록
+        self._filter_commit_timer = QTimer(self)
+        self._filter_commit_timer.setSingleShot(True)
+        self._filter_commit_timer.setInterval(FILTER_COMMIT_MS)
+        self._filter_commit_timer.timeout.connect(self._commit_filter_settings)
+
         self._build_ui()
         self._build_menu_toolbar()
 
         self.apply_theme(self.theme_mode)
         self.on_toggle_best(None)
 
-        # persistent expand thread
+        # persistent expand thread(디스패치) + URL별 확장 작업 풀
+        self.expand_pool = QThreadPool(self)
+        self.expand_pool.setMaxThreadCount(EXPAND_POOL_SIZE)
         self.expand_thread = QThread(self)
-        self.expand_worker = ExpandWorker()
+        self.expand_worker = ExpandWorker(self.expand_pool)
         self.expand_worker.moveToThread(self.expand_thread)
         self.expand_thread.start()
 
@@ -844,6 +1610,16 @@ class MainWindow(QMainWindow):
                 "예) deno 설치 후 다시 실행하세요."
             )
 
+    # ----- Settings -----
+    def _cfg(self, key: str, default, typ):
+        return coerce_setting(self._cfg_cache.get(key), default, typ)
+
+    def write_settings(self):
+        if self._filter_commit_timer.isActive():
+            self._filter_commit_timer.stop()
+            self._commit_filter_settings()
+        self.settings.sync()
+
     # ----- Safe shutdown -----
     def closeEvent(self, event):
         try:
@@ -856,18 +1632,26 @@ class MainWindow(QMainWindow):
             if self.worker_thread and self.worker_thread.isRunning():
                 self.worker_thread.quit()
                 self.worker_thread.wait(5000)
+            _DL_YDL_POOL.close_all()
         except Exception:
             pass
 
         try:
             if self.expand_worker:
                 self.expand_worker.stop()
+            self.expand_pool.waitForDone(5000)
+            self.expand_worker.close()
             if self.expand_thread and self.expand_thread.isRunning():
                 self.expand_thread.quit()
                 self.expand_thread.wait(5000)
         except Exception:
             pass
 
+        try:
+            self.write_settings()
+        except Exception:
+            pass
+
         super().closeEvent(event)
 
     # ----- Drag & Drop -----
@@ -963,59 +1747,27 @@ class MainWindow(QMainWindow):
         self.set_codec_combo(self.codec_pref)
         self.cmb_codec.currentTextChanged.connect(self.on_codec_changed)
 
+        self.spin_fragments = QSpinBox()
+        self.spin_fragments.setRange(1, 16)
+        self.spin_fragments.setValue(int(self.concurrent_fragments))
+        self.spin_fragments.valueChanged.connect(self.on_fragments_changed)
+
+        self.cmb_parallel = QComboBox()
+        self.cmb_parallel.addItems(["1", "2", "3", "4", "6", "8"])
+        idx = self.cmb_parallel.findText(str(self.parallel_videos))
+        if idx >= 0:
+            self.cmb_parallel.setCurrentIndex(idx)
+        self.cmb_parallel.currentTextChanged.connect(self.on_parallel_changed)
+
         form.addRow(self.chk_best)
         form.addRow(QLabel("최대 해상도"), self.cmb_quality)
         form.addRow(QLabel("코덱 선호"), self.cmb_codec)
+        form.addRow(QLabel("동시 조각 다운로드"), self.spin_fragments)
+        form.addRow(QLabel("동시 다운로드 수"), self.cmb_parallel)
         form.addRow(self.chk_thumb)
         form.addRow(self.chk_sub)
         form.addRow(self.chk_logfile)
 
-        gb_cookie = QGroupBox("쿠키(로그인 필요 시)")
-        form_c = QFormLayout(gb_cookie)
-
-        self.chk_cookies = QCheckBox("브라우저에서 쿠키 가져오기")
-        self.chk_cookies.setChecked(bool(self.use_cookies))
-        self.chk_cookies.stateChanged.connect(self.on_toggle_cookies)
-
-        self.cmb_browser = QComboBox()
-        self.cmb_browser.addItems(["chrome", "edge", "firefox"])
-        idx = self.cmb_browser.findText(self.cookie_browser)
-        if idx >= 0:
-            self.cmb_browser.setCurrentIndex(idx)
-        self.cmb_browser.currentTextChanged.connect(self.on_cookie_browser_changed)
-
-        form_c.addRow(self.chk_cookies)
-        form_c.addRow(QLabel("브라우저"), self.cmb_browser)
-
-        gb_filter = QGroupBox("부분 다운로드/필터")
-        form_f = QFormLayout(gb_filter)
-
-        self.chk_ex_shorts = QCheckBox("Shorts 제외")
-        self.chk_ex_shorts.setChecked(bool(self.filter_exclude_shorts))
-        self.chk_ex_shorts.stateChanged.connect(self.on_filter_changed)
-
-        self.in_date_after = QLineEdit(self.filter_date_after)
-        self.in_date_after.setPlaceholderText("YYYY-MM-DD 또는 YYYYMMDD")
-        self.in_date_after.textChanged.connect(self.on_filter_changed)
-
-        self.in_date_before = QLineEdit(self.filter_date_before)
-        self.in_date_before.setPlaceholderText("YYYY-MM-DD 또는 YYYYMMDD")
-        self.in_date_before.textChanged.connect(self.on_filter_changed)
-
-        self.in_kw_in = QLineEdit(self.filter_include_kw)
-        self.in_kw_in.setPlaceholderText("예: '강의' 포함만")
-        self.in_kw_in.textChanged.connect(self.on_filter_changed)
-
-        self.in_kw_out = QLineEdit(self.filter_exclude_kw)
-        self.in_kw_out.setPlaceholderText("예: 'shorts' 제외")
-        self.in_kw_out.textChanged.connect(self.on_filter_changed)
-
-        form_f.addRow(self.chk_ex_shorts)
-        form_f.addRow(QLabel("업로드 이후(dateafter)"), self.in_date_after)
-        form_f.addRow(QLabel("업로드 이전(datebefore)"), self.in_date_before)
-        form_f.addRow(QLabel("제목 포함 키워드"), self.in_kw_in)
-        form_f.addRow(QLabel("제목 제외 키워드"), self.in_kw_out)
-
         self.btn_start = QPushButton("다운로드 시작")
         self.btn_start.setObjectName("Success")
         self.btn_start.clicked.connect(self.on_start)
@@ -1060,14 +1812,11 @@ class MainWindow(QMainWindow):
         d.addStretch(1)
         tabs.addTab(tab_dl, "Download")
 
-        tab_adv = QWidget()
-        a = QVBoxLayout(tab_adv)
-        a.setContentsMargins(0, 10, 0, 0)
-        a.setSpacing(10)
-        a.addWidget(gb_cookie)
-        a.addWidget(gb_filter)
-        a.addStretch(1)
-        tabs.addTab(tab_adv, "Advanced")
+        # Advanced 탭 내용은 처음 열 때 만듦(빈 컨테이너만 먼저 추가)
+        self._tab_adv = QWidget()
+        self._adv_built = False
+        self._adv_index = tabs.addTab(self._tab_adv, "Advanced")
+        tabs.currentChanged.connect(self._on_tab_changed)
 
         left_root.addWidget(tabs, 1)
         left_root.addWidget(self.btn_start)
@@ -1078,16 +1827,20 @@ class MainWindow(QMainWindow):
         r.setContentsMargins(12, 12, 12, 12)
         r.setSpacing(10)
 
-        self.table = QTableWidget(0, 3)
-        self.table.setHorizontalHeaderLabels(["✔", "제목", "상태"])
+        self.model = QueueModel(self.queue, self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
         self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
         self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeToContents)
         self.table.verticalHeader().setVisible(False)
+        # 행 높이는 고정(행마다 내용 기준 높이 계산 생략). 테마 qss의 QTableView::item padding(6px) 위아래 + 테두리 포함
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(self.table.fontMetrics().height() + 2 * 6 + 2)
         self.table.setShowGrid(False)
         self.table.setAlternatingRowColors(True)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableView.SelectRows)
+        self.table.setEditTriggers(QTableView.NoEditTriggers)
 
         self.log = QPlainTextEdit()
         self.log.setReadOnly(True)
@@ -1128,6 +1881,67 @@ class MainWindow(QMainWindow):
         splitter.addWidget(right)
         splitter.setSizes([520, 860])
 
+    @Slot(int)
+    def _on_tab_changed(self, index: int):
+        if index == self._adv_index and not self._adv_built:
+            self._build_advanced_tab()
+
+    def _build_advanced_tab(self):
+        self._adv_built = True
+
+        gb_cookie = QGroupBox("쿠키(로그인 필요 시)")
+        form_c = QFormLayout(gb_cookie)
+
+        self.chk_cookies = QCheckBox("브라우저에서 쿠키 가져오기")
+        self.chk_cookies.setChecked(bool(self.use_cookies))
+        self.chk_cookies.stateChanged.connect(self.on_toggle_cookies)
+
+        self.cmb_browser = QComboBox()
+        self.cmb_browser.addItems(["chrome", "edge", "firefox"])
+        idx = self.cmb_browser.findText(self.cookie_browser)
+        if idx >= 0:
+            self.cmb_browser.setCurrentIndex(idx)
+        self.cmb_browser.currentTextChanged.connect(self.on_cookie_browser_changed)
+
+        form_c.addRow(self.chk_cookies)
+        form_c.addRow(QLabel("브라우저"), self.cmb_browser)
+
+        gb_filter = QGroupBox("부분 다운로드/필터")
+        form_f = QFormLayout(gb_filter)
+
+        self.chk_ex_shorts = QCheckBox("Shorts 제외")
+        self.chk_ex_shorts.setChecked(bool(self.filter_exclude_shorts))
+        self.chk_ex_shorts.stateChanged.connect(self.on_filter_changed)
+
+        self.in_date_after = QLineEdit(self.filter_date_after)
+        self.in_date_after.setPlaceholderText("YYYY-MM-DD 또는 YYYYMMDD")
+        self.in_date_after.textChanged.connect(self.on_filter_changed)
+
+        self.in_date_before = QLineEdit(self.filter_date_before)
+        self.in_date_before.setPlaceholderText("YYYY-MM-DD 또는 YYYYMMDD")
+        self.in_date_before.textChanged.connect(self.on_filter_changed)
+
+        self.in_kw_in = QLineEdit(self.filter_include_kw)
+        self.in_kw_in.setPlaceholderText("예: '강의' 포함만")
+        self.in_kw_in.textChanged.connect(self.on_filter_changed)
+
+        self.in_kw_out = QLineEdit(self.filter_exclude_kw)
+        self.in_kw_out.setPlaceholderText("예: 'shorts' 제외")
+        self.in_kw_out.textChanged.connect(self.on_filter_changed)
+
+        form_f.addRow(self.chk_ex_shorts)
+        form_f.addRow(QLabel("업로드 이후(dateafter)"), self.in_date_after)
+        form_f.addRow(QLabel("업로드 이전(datebefore)"), self.in_date_before)
+        form_f.addRow(QLabel("제목 포함 키워드"), self.in_kw_in)
+        form_f.addRow(QLabel("제목 제외 키워드"), self.in_kw_out)
+
+        a = QVBoxLayout(self._tab_adv)
+        a.setContentsMargins(0, 10, 0, 0)
+        a.setSpacing(10)
+        a.addWidget(gb_cookie)
+        a.addWidget(gb_filter)
+        a.addStretch(1)
+
     def _build_menu_toolbar(self):
         menu = self.menuBar()
         m_file = menu.addMenu("파일")
@@ -1183,6 +1997,10 @@ class MainWindow(QMainWindow):
 
         tb.addSeparator()
 
+        act_clear_cache = QAction("메타데이터 캐시 비우기", self)
+        act_clear_cache.triggered.connect(self.on_clear_expand_cache)
+        tb.addAction(act_clear_cache)
+
         act_theme_toggle = QAction("테마 토글", self)
         act_theme_toggle.setShortcut(QKeySequence("Ctrl+T"))
         act_theme_toggle.triggered.connect(self.toggle_theme_quick)
@@ -1192,21 +2010,26 @@ class MainWindow(QMainWindow):
 
     # Theme
     def apply_theme(self, mode: str):
+        mode = (mode or "dark").lower()
+        # 같은 테마를 다시 적용하면 전체 위젯 re-polish만 일어나므로 건너뜀
+        if self._theme_applied and mode == self.theme_mode:
+            return
+
         app = QApplication.instance()
         app.setStyle("Fusion")
-        mode = (mode or "dark").lower()
 
         if mode == "dark":
             app.setPalette(palette_dark_discord())
-            self.setStyleSheet(QSS_DARK)
+            self.setStyleSheet(load_qss("dark"))
         elif mode == "light":
             app.setPalette(palette_light_clean())
-            self.setStyleSheet(QSS_LIGHT)
+            self.setStyleSheet(load_qss("light"))
         else:
             app.setPalette(app.style().standardPalette())
-            self.setStyleSheet(QSS_LIGHT)
+            self.setStyleSheet(load_qss("light"))
 
         self.theme_mode = mode
+        self._theme_applied = True
         self._sync_theme_actions()
 
     def set_theme(self, mode: str):
@@ -1229,15 +2052,7 @@ class MainWindow(QMainWindow):
         self.cmb_quality.setEnabled(not self.force_best)
 
     def quality_to_height(self, text: str) -> int:
-        t = (text or "").lower()
-        if "4320" in t or "8k" in t:
-            return 4320
-        if "2160" in t or "4k" in t:
-            return 2160
-        for n in [1440, 1080, 720, 480, 360, 240, 144]:
-            if str(n) in t:
-                return n
-        return 1080
+        return _quality_to_height(text or "")
 
     def set_quality_combo(self, saved: str):
         saved = (saved or "1080p").lower()
@@ -1275,12 +2090,34 @@ class MainWindow(QMainWindow):
         self.log_to_file = self.chk_logfile.isChecked()
         self.settings.setValue("log_to_file", self.log_to_file)
 
+    def on_fragments_changed(self, value: int):
+        self.concurrent_fragments = int(value)
+        self.settings.setValue("concurrent_fragments", self.concurrent_fragments)
+
+    def on_parallel_changed(self, text: str):
+        try:
+            self.parallel_videos = max(1, int(text))
+        except ValueError:
+            self.parallel_videos = 1
+        self.settings.setValue("parallel_videos", self.parallel_videos)
+
     # Cookies
     def on_toggle_cookies(self, _):
         self.use_cookies = self.chk_cookies.isChecked()
         self.settings.setValue("use_cookies", self.use_cookies)
         self.expand_worker.set_cookiesfrombrowser.emit(self.build_cookiesfrombrowser())
 
+    def _set_use_cookies(self, on: bool):
+        """
+        쿠키 사용 여부 변경. Advanced 탭이 아직 안 만들어졌으면 체크박스 없이 상태만 반영.
+        """
+        if self._adv_built:
+            self.chk_cookies.setChecked(on)
+            return
+        self.use_cookies = on
+        self.settings.setValue("use_cookies", self.use_cookies)
+        self.expand_worker.set_cookiesfrombrowser.emit(self.build_cookiesfrombrowser())
+
     def on_cookie_browser_changed(self, text: str):
         self.cookie_browser = (text or "chrome").lower()
         self.settings.setValue("cookie_browser", self.cookie_browser)
@@ -1293,7 +2130,12 @@ class MainWindow(QMainWindow):
         self.filter_date_before = self.in_date_before.text().strip()
         self.filter_include_kw = self.in_kw_in.text().strip()
         self.filter_exclude_kw = self.in_kw_out.text().strip()
+        self._filter_include_kw_lower = self.filter_include_kw.lower()
+        self._filter_exclude_kw_lower = self.filter_exclude_kw.lower()
+        self._filter_commit_timer.start()
 
+    @Slot()
+    def _commit_filter_settings(self):
         self.settings.setValue("filter_exclude_shorts", self.filter_exclude_shorts)
         self.settings.setValue("filter_date_after", self.filter_date_after)
         self.settings.setValue("filter_date_before", self.filter_date_before)
@@ -1327,43 +2169,71 @@ class MainWindow(QMainWindow):
         self.settings.setValue("codec_pref", self.codec_pref)
 
     # Helpers
+    @Slot(str)
     def append_log(self, s: str):
-        self.log.appendPlainText(s)
+        self._log_buffer.append(s)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    @Slot()
+    def _flush_log(self):
+        if not self._log_buffer:
+            return
+        # 확장 중에는 로그 뷰 다시 그리기를 멈춰 두고 확장이 끝나면 한 번에 갱신
+        if self._pending_count > 0 and self.log.updatesEnabled():
+            self.log.setUpdatesEnabled(False)
+        self.log.appendPlainText("\n".join(self._log_buffer))
+        self._log_buffer.clear()
+        if self.log.updatesEnabled() and not self._ui_hidden():
+            self.log.verticalScrollBar().setValue(self.log.verticalScrollBar().maximum())
+
+    def _resume_log_updates(self):
+        if self.log.updatesEnabled():
+            return
+        self.log.setUpdatesEnabled(True)
         self.log.verticalScrollBar().setValue(self.log.verticalScrollBar().maximum())
+        self.log.viewport().update()
 
     def set_status(self, s: str):
         self.lbl_status.setText(s)
         self.statusBar().showMessage(s)
 
     def render_table_all(self):
-        self.table.setUpdatesEnabled(False)
-        try:
-            self.table.setRowCount(len(self.queue))
-            for row, it in enumerate(self.queue):
-                it0 = QTableWidgetItem()
-                it0.setFlags(it0.flags() | Qt.ItemIsUserCheckable)
-                it0.setCheckState(Qt.Checked)
-                self.table.setItem(row, 0, it0)
-                self.table.setItem(row, 1, QTableWidgetItem(it.title or it.url))
-                self.table.setItem(row, 2, QTableWidgetItem(it.status or "Queued"))
-        finally:
-            self.table.setUpdatesEnabled(True)
-            self.table.viewport().update()
+        self.model.reset()
+
+    def render_table_new_rows(self):
+        """
+        기존 행(체크 상태 포함)은 그대로 두고 새로 추가된 대기열 항목만 모델에 반영.
+        """
+        self.model.sync_appended()
 
     def refresh_state(self):
+        # 같은 이벤트 루프 턴에서 여러 번 불려도 한 번만 갱신
+        if not self._state_timer.isActive():
+            self._state_timer.start()
+
+    @Slot()
+    def _refresh_state_now(self):
         expanding = self._pending_count > 0
+        if not expanding:
+            # 중지 등으로 idle 없이 확장이 끝난 경우에도 로그 뷰 갱신 재개
+            self._resume_log_updates()
         downloading = self.worker is not None
         working = expanding or downloading
         can_start = (len(self.queue) > 0) and bool(self.save_folder) and (not working)
 
-        self.btn_start.setEnabled(can_start)
-        self.btn_stop.setEnabled(working)
+        # 활성 상태가 그대로면 setEnabled 호출 생략
+        enable_state = (can_start, working)
+        if enable_state != self._last_enable_state:
+            self._last_enable_state = enable_state
+            self.btn_start.setEnabled(can_start)
+            self.btn_stop.setEnabled(working)
 
-        self.btn_add.setEnabled(not working)
-        self.btn_remove.setEnabled(not working)
-        self.btn_clear.setEnabled(not working)
-        self.btn_pick.setEnabled(not working)
-        self.url_input.setEnabled(not working)
+            self.btn_add.setEnabled(not working)
+            self.btn_remove.setEnabled(not working)
+            self.btn_clear.setEnabled(not working)
+            self.btn_pick.setEnabled(not working)
+            self.url_input.setEnabled(not working)
 
         self.lbl_folder.setText("저장 폴더: (미선택)" if not self.save_folder else f"저장 폴더: {self.save_folder}")
 
@@ -1387,18 +2257,29 @@ class MainWindow(QMainWindow):
         return any(k in s for k in keywords)
 
     # Expand API
-    def add_urls_as_queue(self, urls: list[str]):
-        urls = [normalize_url(u) for u in urls if normalize_url(u)]
-        if not urls:
+    def add_urls_as_queue(self, urls):
+        # 정규화/중복 제거/videos 탭 변환을 한 번의 루프로 처리(입력 순서 유지)
+        seen = self.url_index
+        out: dict[str, None] = {}
+        skipped = 0
+        for u in urls:
+            nu = normalize_url(u)
+            if not nu:
+                continue
+            if url_hash(nu) in seen:
+                skipped += 1
+                continue
+            out[normalize_channel_to_videos(nu)] = None
+        if skipped:
+            self.append_log(f"이미 대기열에 있음: {skipped}개")
+        if not out:
             return
+        fixed = list(out)
 
-        fixed = [normalize_channel_to_videos(u) for u in urls]
         self._pending_count += len(fixed)
         self.append_log(f"입력됨: {len(fixed)}개 (pending={self._pending_count})")
 
-        for u in fixed:
-            self._pending_urls.append(u)
-            self.expand_worker.request.emit(u)
+        self.expand_worker.request_batch.emit(self._expand_gen, fixed)
 
         self.refresh_state()
 
@@ -1407,12 +2288,13 @@ class MainWindow(QMainWindow):
         self._expanding_collected_count = n
         self.refresh_state()
 
-    @Slot(bool, str, list)
-    def on_expand_finished_one(self, ok: bool, msg: str, collected: list):
+    @Slot(int, str, bool, str, list)
+    def on_expand_finished_one(self, gen: int, src_url: str, ok: bool, msg: str, collected: list):
+        # 중지 전에 보낸 요청의 결과(큐에 남아 있던 시그널)는 무시
+        if gen != self._expand_gen:
+            return
         self.append_log(msg)
 
-        src_url = self._pending_urls.popleft() if self._pending_urls else ""
-
         self._pending_count = max(0, self._pending_count - 1)
         self._expanding_collected_count = 0
 
@@ -1432,25 +2314,36 @@ class MainWindow(QMainWindow):
                     self._expand_retry_once.add(src_url)
 
                     # 쿠키 ON + ExpandWorker 갱신
-                    self.chk_cookies.setChecked(True)
+                    self._set_use_cookies(True)
 
                     # 동일 URL 재확장
                     self._pending_count += 1
-                    self._pending_urls.appendleft(src_url)
-                    self.expand_worker.request.emit(src_url)
+                    self.expand_worker.request.emit(self._expand_gen, src_url)
                     self.append_log(f"재시도 예약(쿠키 ON): {src_url}")
                     self.refresh_state()
                     return
 
-        added = 0
+        fresh: dict[int, QueueItem] = {}
         for it in collected:
-            u = normalize_url(getattr(it, "url", "") or "")
-            t = getattr(it, "title", "") or u
-            if not u or u in self.url_set:
+            u = normalize_url(it.url or "")
+            if not u:
                 continue
-            self.url_set.add(u)
-            self.queue.append(QueueItem(url=u, title=t, status="Queued"))
-            added += 1
+            h = url_hash(u)
+            if h not in fresh:
+                if u != it.url or not it.title:
+                    it = QueueItem(url=u, title=it.title or u)
+                fresh[h] = it
+
+        new_hashes = fresh.keys() - self.url_index
+        added = len(new_hashes)
+        if added:
+            base = len(self.queue)
+            new_items = []
+            for h, it in fresh.items():
+                if h in new_hashes:
+                    self.url_index[h] = base + len(new_items)
+                    new_items.append(it)
+            self.queue.extend(new_items)
 
         if added:
             self.append_log(f"확장 반영: +{added}개 (총 {len(self.queue)}개)")
@@ -1461,7 +2354,9 @@ class MainWindow(QMainWindow):
     def on_expand_idle(self):
         if self._pending_count == 0:
             self.append_log("확장 idle: 테이블 일괄 렌더링")
-            self.render_table_all()
+            self._flush_log()
+            self._resume_log_updates()
+            self.render_table_new_rows()
             self.refresh_state()
 
     # Actions
@@ -1485,38 +2380,46 @@ class MainWindow(QMainWindow):
         self.add_urls_as_queue([url])
 
     def on_remove_checked(self):
-        rows = []
-        for r in range(self.table.rowCount()):
-            it = self.table.item(r, 0)
-            if it and it.checkState() == Qt.Checked:
-                rows.append(r)
+        rows = self.model.checked_rows()
 
         if not rows:
             QMessageBox.information(self, "안내", "체크된 항목이 없습니다.")
             return
 
-        for r in reversed(rows):
-            if 0 <= r < len(self.queue):
-                self.url_set.discard(self.queue[r].url)
-                self.queue.pop(r)
+        rows = [r for r in rows if 0 <= r < len(self.queue)]
+        self.model.remove_rows(rows)
+        # 한 번의 순회로 남은 행의 위치를 다시 매김
+        self.url_index = {url_hash(u): i for i, u in enumerate(self.queue.urls)}
 
         self.append_log(f"삭제됨: {len(rows)}개")
-        self.render_table_all()
         self.refresh_state()
 
     def on_clear(self):
-        self.table.setRowCount(0)
-        self.queue.clear()
-        self.url_set.clear()
-        self._pending_urls.clear()
+        self.model.clear()
+        self.url_index.clear()
         self.append_log("대기열 초기화")
         self.refresh_state()
 
+    def on_clear_expand_cache(self):
+        try:
+            n = _expand_cache().clear()
+        except Exception as e:
+            QMessageBox.warning(self, "오류", f"캐시 비우기 실패: {e}")
+            return
+        self.append_log(f"메타데이터 캐시 비움: {n}개")
+
     def build_format_string(self) -> str:
+        # (force_best, max_quality)가 그대로면 이전 결과 재사용
+        key = (self.force_best, self.max_quality)
+        if self._fmt_cache is not None and self._fmt_cache[0] == key:
+            return self._fmt_cache[1]
         if self.force_best:
-            return "bestvideo+bestaudio/best"
-        h = self.quality_to_height(self.max_quality)
-        return f"bestvideo[height<={h}]+bestaudio/best[height<={h}]"
+            fmt = "bestvideo+bestaudio/best"
+        else:
+            h = self.quality_to_height(self.max_quality)
+            fmt = f"bestvideo[height<={h}]+bestaudio/best[height<={h}]"
+        self._fmt_cache = (key, fmt)
+        return fmt
 
     def build_format_sort(self) -> list[str] | None:
         if self.codec_pref == "h264":
@@ -1582,19 +2485,25 @@ class MainWindow(QMainWindow):
             cookiesfrombrowser=cookies,
             js_runtimes=plan["js_runtimes"],
             filter_opts=plan["filter_opts"],
+            concurrent_fragments=plan["concurrent_fragments"],
+            parallel_videos=plan["parallel_videos"],
+            rows=plan["rows"],
         )
 
         self.worker.moveToThread(self.worker_thread)
         self.worker_thread.started.connect(self.worker.run)
 
-        self.worker.log.connect(self.append_log)
-        self.worker.current_title.connect(lambda t: self.lbl_now.setText(f"현재: {t}"))
-        self.worker.file_progress.connect(self.pb_file.setValue)
-        self.worker.total_progress.connect(self.pb_total.setValue)
-        self.worker.file_eta.connect(lambda s: self.lbl_file_eta.setText(f"파일 남은 시간: {s}"))
-        self.worker.total_eta.connect(lambda s: self.lbl_total_eta.setText(f"전체 남은 시간: {s}"))
-
-        self.worker.finished.connect(self.on_download_finished)
+        # 워커 스레드 → GUI 스레드: 람다 대신 바운드 슬롯/C++ 슬롯을 큐 연결로 직접 연결
+        queued = Qt.QueuedConnection
+        self.worker.log.connect(self.append_log, queued)
+        self.worker.current_title.connect(self._set_now_title, queued)
+        self.worker.file_progress.connect(self.pb_file.setValue, queued)
+        self.worker.total_progress.connect(self.pb_total.setValue, queued)
+        self.worker.file_eta.connect(self._set_file_eta, queued)
+        self.worker.total_eta.connect(self._set_total_eta, queued)
+
+        self.worker.item_status.connect(self.on_item_status, queued)
+        self.worker.finished.connect(self.on_download_finished, queued)
         self.worker.finished.connect(self.worker_thread.quit)
 
         self.worker_thread.finished.connect(self.worker.deleteLater)
@@ -1604,6 +2513,44 @@ class MainWindow(QMainWindow):
         self.worker_thread.start()
         self.refresh_state()
 
+    @Slot(str)
+    def _set_now_title(self, t: str):
+        self._set_label_lazy(self.lbl_now, f"현재: {t}")
+
+    @Slot(str)
+    def _set_file_eta(self, s: str):
+        self._set_label_lazy(self.lbl_file_eta, f"파일 남은 시간: {s}")
+
+    @Slot(str)
+    def _set_total_eta(self, s: str):
+        self._set_label_lazy(self.lbl_total_eta, f"전체 남은 시간: {s}")
+
+    def _ui_hidden(self) -> bool:
+        return self.isMinimized() or not self.isVisible()
+
+    def _set_label_lazy(self, lbl: QLabel, text: str):
+        # 창이 안 보이면 마지막 값만 기억해 두고 다시 보일 때 반영
+        if self._ui_hidden():
+            self._deferred_labels[lbl] = text
+        else:
+            lbl.setText(text)
+
+    def _apply_deferred_ui(self):
+        for lbl, text in self._deferred_labels.items():
+            lbl.setText(text)
+        self._deferred_labels.clear()
+        if self.log.updatesEnabled():
+            self.log.verticalScrollBar().setValue(self.log.verticalScrollBar().maximum())
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange and not self._ui_hidden():
+            self._apply_deferred_ui()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._apply_deferred_ui()
+
     def on_start(self):
         if not self.save_folder:
             QMessageBox.information(self, "안내", "저장 폴더를 먼저 선택하세요.")
@@ -1613,28 +2560,34 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "안내", "현재 채널/재생목록 펼치는 중입니다. 끝난 뒤 시작하세요.")
             return
 
-        idxs = []
-        for r in range(self.table.rowCount()):
-            it = self.table.item(r, 0)
-            if it and it.checkState() == Qt.Checked:
-                idxs.append(r)
+        idxs = self.model.checked_rows()
 
         if not idxs:
             QMessageBox.information(self, "안내", "체크된 항목이 없습니다.")
             return
 
-        items = []
-        for i in idxs:
-            qi = self.queue[i]
-            if self.filter_exclude_shorts and "/shorts/" in (qi.url or "").lower():
-                continue
-            if self.filter_include_kw and self.filter_include_kw.lower() not in (qi.title or "").lower():
-                continue
-            if self.filter_exclude_kw and self.filter_exclude_kw.lower() in (qi.title or "").lower():
-                continue
-            items.append(qi)
+        shorts = self.queue.shorts
+        titles_lower = self.queue.titles_lower
+        # 필터 값은 루프 밖에서 한 번만 소문자로 변환
+        ex_shorts = self.filter_exclude_shorts
+        inc = self._filter_include_kw_lower or None
+        exc = self._filter_exclude_kw_lower or None
+        if not (ex_shorts or inc or exc):
+            rows = idxs
+        else:
+            rows = []
+            for i in idxs:
+                if ex_shorts and shorts[i]:
+                    continue
+                if inc or exc:
+                    t = titles_lower[i]
+                    if inc and inc not in t:
+                        continue
+                    if exc and exc in t:
+                        continue
+                rows.append(i)
 
-        if not items:
+        if not rows:
             QMessageBox.information(self, "안내", "필터 결과 다운로드할 항목이 없습니다.")
             return
 
@@ -1658,9 +2611,11 @@ class MainWindow(QMainWindow):
             self.append_log(f"JS runtimes: {list(js_runtimes.keys())}")
         if filter_opts:
             self.append_log(f"다운로드 필터: {filter_opts}")
+        self.append_log(f"동시 조각 다운로드: {self.concurrent_fragments} / 동시 다운로드 수: {self.parallel_videos}")
 
         plan = {
-            "items": [QueueItem(url=x.url, title=x.title, status=x.status) for x in items],
+            "items": self.queue.subset(rows),
+            "rows": rows,
             "save_folder": self.save_folder,
             "keep_thumb": self.keep_thumb,
             "keep_sub": self.keep_sub,
@@ -1670,6 +2625,8 @@ class MainWindow(QMainWindow):
             "cookies": cookies,
             "js_runtimes": js_runtimes,
             "filter_opts": filter_opts,
+            "concurrent_fragments": self.concurrent_fragments,
+            "parallel_videos": self.parallel_videos,
         }
 
         self._last_download_plan = plan
@@ -1680,13 +2637,12 @@ class MainWindow(QMainWindow):
 
     def on_stop(self):
         try:
-            self.expand_worker.stop()
+            self._expand_gen = self.expand_worker.stop()
         except Exception:
             pass
 
         self._pending_count = 0
         self._expanding_collected_count = 0
-        self._pending_urls.clear()
 
         try:
             if self.worker:
@@ -1704,6 +2660,16 @@ class MainWindow(QMainWindow):
         self.append_log("중지 요청됨(확장/다운로드)")
         self.refresh_state()
 
+    @Slot(int, str, str)
+    def on_item_status(self, row: int, url: str, status: str):
+        # 다운로드 시작 후 행이 지워지거나 밀렸으면 URL로 현재 행을 다시 찾음
+        if not (0 <= row < len(self.queue) and self.queue.urls[row] == url):
+            row = self.url_index.get(url_hash(url), -1)
+            if row < 0:
+                return
+        self.queue.statuses[row] = status
+        self.model.status_changed(row)
+
     @Slot(bool, str)
     def on_download_finished(self, ok: bool, msg: str):
         self.refresh_state()
@@ -1728,7 +2694,7 @@ class MainWindow(QMainWindow):
                 self._last_fail_message = msg
 
                 # 쿠키 ON + ExpandWorker 갱신까지 자동 반영
-                self.chk_cookies.setChecked(True)
+                self._set_use_cookies(True)
 
                 self.append_log("사용자 선택: 쿠키 ON → 스레드 종료 후 자동 재시도 예약")
                 return
@@ -1754,8 +2720,8 @@ class MainWindow(QMainWindow):
         if not path:
             return
         with open(path, "w", encoding="utf-8") as f:
-            for it in self.queue:
-                f.write(it.url + "\n")
+            for u in self.queue.urls:
+                f.write(u + "\n")
         self.append_log(f"대기열 TXT 저장됨: {path}")
 
     def on_load_queue_txt(self):
@@ -1770,17 +2736,8 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "오류", f"불러오기 실패: {e}")
             return
 
-        urls = []
-        for line in text.splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            found = extract_urls_from_text(line)
-            if found:
-                urls.extend(found)
-            else:
-                if line.startswith("http"):
-                    urls.append(line)
+        # 줄 단위가 아니라 파일 전체를 한 번에 스캔
+        urls = extract_urls_from_text(text)
 
         if not urls:
             QMessageBox.information(self, "안내", "TXT에서 URL을 찾지 못했습니다.")
@@ -1792,17 +2749,29 @@ class MainWindow(QMainWindow):
         path, _ = QFileDialog.getSaveFileName(self, "로그 저장", "", "Text (*.txt)")
         if not path:
             return
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(self.log.toPlainText())
+        self._flush_log()
+        # 문서 전체를 문자열 하나로 만들지 않고 블록(줄) 단위로 기록
+        with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            block = self.log.document().firstBlock()
+            while block.isValid():
+                f.write(block.text())
+                f.write("\n")
+                block = block.next()
         self.append_log(f"로그 저장됨: {path}")
 
 
 def main():
-    crash_fp = _setup_faulthandler()
-    qt_fp = _setup_qt_message_log()
+    # PyInstaller로 묶인 exe에서 확장 프로세스(spawn)가 다시 GUI를 띄우지 않도록
+    multiprocessing.freeze_support()
+
+    crash_fd = _setup_faulthandler()
+    qt_fd = _setup_qt_message_log()
 
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
+    # AppDataLocation(확장 캐시 경로)이 실행 파일 이름에 따라 바뀌지 않도록 고정
+    app.setOrganizationName(MainWindow.ORG)
+    app.setApplicationName(MainWindow.APP)
 
     win = MainWindow()
     win.apply_theme(win.theme_mode)
@@ -1812,16 +2781,14 @@ def main():
         code = app.exec()
     finally:
         try:
-            qt_fp.write(f"=== qt session end {time.strftime('%Y-%m-%d %H:%M:%S')} ===\n")
-            qt_fp.flush()
-            qt_fp.close()
+            _log_write(qt_fd, f"=== qt session end {time.strftime('%Y-%m-%d %H:%M:%S')} ===\n")
+            _log_close(qt_fd)
         except Exception:
             pass
 
         try:
-            crash_fp.write(f"=== session end {time.strftime('%Y-%m-%d %H:%M:%S')} ===\n")
-            crash_fp.flush()
-            crash_fp.close()
+            _log_write(crash_fd, f"=== session end {time.strftime('%Y-%m-%d %H:%M:%S')} ===\n")
+            _log_flush()
         except Exception:
             pass
 
@@ -0,0 +1,157 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.12.0
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x03v\
+(\
+\xb5/\xfd`\xd8\x0be\x1b\x00\x96bi \x10\xb3\x1e\
+\xfco \x97\x0fw\xb5}T\xafl\x16#\x98\xd5\xf2\
+\xbc)\xe6\x97\xd3aD?\x22\x00P\x00\x80b\x00]\
+\x00]\x00\x00Oo.v5\xcc=\xfc\xc6#\xb6\xce\
+\xce\xf1\xe8\xc1W\x8ap[\x0b\x88,\xcb\x0eY\xfe~\
+~\xc2\x8a\xa2\xaa\xe5[\xb8\xea\x9a\x08b\xa7\xd3\x17\x19\
+\x06\xb1\xeb\x12\xb4\xc4\xb7\xbb\x9bw\xaf}\x10A\xe7\xda\
+l<\x00\x9f\xb66^\x94Zz\xa7f+\xc0\x90\xb4\
+_\xce!\x81\x96\x9c\xaebf\x05z{+\xed\xe9w\
+\x8eV\xca\x03\x10o\x1dO/\xdb\x89\x9f\xd0\xf2+\xde\
+\xb9\xbd\xb6\xa5s\x13S5\x17\xe3\x09U\xb0\xa5\xe5i\
+\xd5X\xcd\xa5\x90w1\x95\xed\xe9\xfcm\xb7\x22?\x00\
+\x0b&(BEA\x90\xbd\xf57\xef<s\xb6R:\
+\xbd\xfcU:1DA\x08#(hZ\xbb\x9b{\xe3\
+a\xa7\xf8Z\x84(\xc5\x04\xa4\xf6\xbb\x98\xbblS\xeb\
+\xee\x0e\x98\xfb\x7f\xb5\x0aN0R\xcf\xd9\xb1\x07%\x98\
+\x90\xacC,\xc4\x09{\xe6Z\xe4\xc7\xde\xff\x0f\xb3\xe4\
+\xcf1MY\xbc\xa2\xa7\xa9\xcb\xf64\xc6\xbfJ\x99\xa5\
+\x94b\x061\xe8?-\xf6\xef\xa6\xc6\xeb\xc4;mF\
+\x08\x1d\xf5\xad_\xf3\xf5,Y\xf1\x85\xba\x8b\xdf\xdeM\
+\xfb\xeaK\xf9\x81\x9e\xc2V\x0eOL\xd5\xd2\xbb\x1f\x80\
+\xcfes\x8b6\xdf\xed\xf4\xa4\xec\x8b\xfd,\x9b\x94\xd8\
+\xdf\xfa\xd6\xd2r\xb5\x9b\xd0o\xfc'\xb7\xe0\x89q\x17\
+G\x11\x01\x0d\x17\x22\x1eb\x95a\x11FMp\xca\x10\
+\x9c\x9d\xd9\x15/\xc2\x04#J2\xc4\x18]\x12\x16\x1d\
+(\xea\xc2r\xf6m\xfb \x14FM\x07\x02\xe2\xa2\x10\
+\x13\x07OL\xc5\x0e\x81\x15\x19\xa4\x0a+t\xda\xcc\x95\
+\x06\x80\xc9\xa8!\x1a\x19\x99#I\x92\x14\xb2\x8c\x01P\
+\x84\x04\x84\xcal\x1e\xf2 \x8c\xa7 \x1cb\x19\x0a\x92\
+\x04)\xe2I\x89H \xe5\x94YHc\x1b\x8c\x02%\
+[\x15Qv\x87\xde94\x06\x8f\x8b\xafy\x93\xef\x9d\
+3\x09M\xef\xbe\x84*\x0d\x93x<'\xa5^\xd2\xb6\
+\x0f\xb3\xc5\x11f\xe8\x85\xb8\xc9\xf0\x10\x0a1d\x16\xad\
+U\xea,\xe9\xa4\xfe\xcb\x01k<\x97EH\x8f\xb0P\
+3\xbd\x1a\x00\xee\xf5w\x1eQs\xe8h\xf9WV\x08\
+\xbdH)$\x9e\x8d\x9d\x84\xc6R\xa9s|\xfe\xf3\x81\
+\x80V\x1c\xf13\x10Lm\x91\xa1\xf9\x08\x84\xa0\x0b\x07\
+/\xcf\x90\xd4,\x8c\xfc\x9dC;\xca\x0d\x01\x07\xad\xb6\
+U\x94\xc2\xc3c\x04\x86\xd3nD\x84{\xc9\xfe\x10\x8e\
+\xab\x83i\xd4\xe2\xbaHr\x95b\x06\xdf\xb7\x5c\x06%\
+T-:\xa8.Gj\x8c\xde}\xcb\x81\xaa\xb4\x18{\
+\x13=\xb9M\xfd\x82\xc6\x92Yf\xfb\x12CRn;\
+\xfd\x97D\xf6vm\x12\x9b\x92\x8e\xdcd\x05\x89s\xc3\
+\x97M\xf0\x09\x0d\xa4=\x03\x01\x04qN[\xd34\x9e\
+C\xbf\xf7\xfauw\xf4\x18<F\xff\x22B \x8d\xdd\
+\x5c\x0b\xc7m+\xa2qr\xbe\xcb\xc5O\xaa\xce\xc3\x98\
+\x11\x85V\xa9_\xcde\xa3!\xa3e\x8c\x0e\x95\x99l\
+\xfa#\xbf\x85\xa8X\x90\x7fg\x03\xf9\xc5<\xcfc>\
+\xb2\xec\x16j\x91/\x93'>\xb4[\x19R\xa6\xf8P\
+\xd5\xb6}<}\xd4\xad\x0c\xc1>\xabg\x98\x8c\x88\x0a\
+ \x91\x020\xc6L\xe3\x85m\x10\xa0\xa0\xa8\x8c\x5c\xa3\
+\xbcJq\xf0j\xac\x0a\x8a\x1b\xb6\xdd\x9bD\xc2\x8a/\
+\x05\xc0+\xdcj\x9aEYK=%}5\x89\x9e\xce\
+!\x9dS3L_=j\xdc~\xbd\x86\xf0\x10\x14\x00\
+U\xf1\x81\x99\x107\xc5\x11\x00\xa2\x0f\xb4\x97'\xfd\xf7\
+\xd4\xb1;T\x01\
+\x00\x00\x03V\
+(\
+\xb5/\xfd`E\x0be\x1a\x00V\x22h \x10\xd36\
+\xfc?,+c\x02\xb8\xdbE\x84{\xba\xf54\x8e\x01\
+\xb4\xb0\xc6\xbc\xaf7 6\x22\x00P\x80\x83`\x00\x5c\
+\x00\x5c\x00~9\x87q\xec7\x1d\xa9T~\x8e\x07\x0f\
+\x9eN\xad+\x8d\x0c7|\xf9\x86\xc9\x92$\x09\x11E\
+\x16\xc7\xb7x\xb45\xd1d{\xca^D\xd6d\xb8*\
+\x01G\xeb\x9fw\xec\xe1\xfe\x9e\x0b!\x82\xaf9\xd9x\
+\x00>\x8c\xd8\x80\x94\xc4\xb1;\xf4\x22\x02\x0c\x09\xb7{\
+\x0d\x09p\xe4|\x14#+\xd0W\xaf\xb0\x87\xbf\xbdI\
+)\x0f@\xe0\xad\xd2~\xc5\xf1+\xfdu\xf5\xca\xb1=\
+\x89\xa1\x1a\xb7VB\x1b\xd0\x9a8Z~RM\xd5\xf8\
+\x84@\xb73\xb2\x87o\xd8y%~4\xaa*L\x10\
+T\x9d~\xd7__\xaf\xd29%xC:\xa5\x85\xae\
+\xac\x90I\x99\x80'\xfd\xfc\xf2\x06\x948\xda\x9e\xd6\x11\
+\x9b\x80\xe3\xac\xa1[\xef\xd2I\x8e\x99\x19\xe0\xe1M\x19\
+f\xc0f\xdf\xdb\x16d\xdb\x19\xb7\xc4\xcf\xa5\x19\xb4\x82\
+V\xfd?\xbc,7th[B\xbb\xb2\xd9\xb1\xf20\
+\xa6\x9f\xc6\xf8\xf1\xf0\x8d\xb1\xda\x08\x1b\xb5\xf5\xcbj\xfb\
+?\xa9i:\xe9\x8f\x93\x91\x8a#v\xfa\xf4:\x88\x88\
+\xd4:\xf4\xb9\xfd\xea\x1d\x17\xde\xfe\x9e~\x8c\x9f\x09T\
+T\xeaY\x89\xb18\x82\xfe_\xdb\xca\x80\x0f\xb3\xc5\xc9\
+\xef*\xc1\x18\xf9RCK\x17\xa3\xed\xaf\xddq\xac\x1e\
+\xfd$\xf4\x9b~B[\xac\xbc<\xb7\x97tI\x87\x03\
+&a\xd2\xe1\xaa\xa6j\xc2\xbc*3\x02U\xa8\xaa\x8c\
+\x8a\xacB\x82@%*\xe9\xde\xee\xba\x10\xb2%\x22\x82\
+fe\x1a!\x93\xfa\xa9E\xc3\xb1\x12C\xadC\xb0%\
+\xa8\x04v\x98\x97N\x8c\xff;We\x01\x80\xba\xa8\xf1\
+\xa112G\x92\xa4\xa0\xa4\x92\x0e@\x84\x08H\x95\xd9\
+<\x92 \x8e\x8924\x85Q\x90qZ@\x88'$\
+\x94\xa4\x9c\xa2$\xe9_\x9a8\xf6\xd5\xa3\x06P\xe5\xf9\
+5\x80\xcb\xc4\x9c$\xc8\xbcAH\xa2|c2\x8aV\
+\x12\x14$\xc2\x127\xdbD4\xefQ\x83`Z\xe3\xf9\
+*&3\xf3\x1ae\xe4\xd6F\x86\x976D\x01#\xa1\
+'\x9bT|\xd7.\xde\x9c\xe9x\xf3\x0f\xc6\xd2\xc06\
+\xa9\x9c}[<\xb7\xa0a\xc3\xac\xd6\xe8L-\x1b:\
+\xc6\x90\xc2\xa5p\xc2\x03\x00\x1b~,\xb9\xbc\xe7\x8d9\
+\x13\xdb\xcc\xcb\xaa\xdd\x11\x9a\x8c\xc4(\x8b\xe7n3Z\
+\x98.\xf1Dh\x10\x89%E\xb5\x09\xca\x07\x1bo\xf2\
+f\x09\x89\xb2{\xc0\xcf\xcfF\xf7]\xa7\x09\x88\xf3\xa2\
+T\xa1\xe0\x0e\xdas{\x7f\xde\x1a\x99L\xde\xe5\xa36\
+l\x8d\xfc`%\xe0\xe5\x06\x91\xe0\x90m\xc6\x0e!\x01\
+\xb9\x94\x88\xa6\xd9\xfe\xc9\x9c\xa8\x82ZP\x81\x09\xea\x89\
+\xf5\x08\x18$8\xea\xea\xba\x0c\x862{^\x06\x9d\x93\
+mA\xee\x0a\xe0\xc2O\xf4H\x89\xf3ns\xa3\xc1v\
+\xbe\xa2+\x99\xca\xe3\x01Q\x17C\xab\xd4/\xba\xec@\
+\x96\xd15F\x15\xc8\x0cmz$\xbe\x85\xb9\x02\xb1\x92\
+m\xdeT\xc9\xa7KE\xe1,\xaai\xf2\x88\x0fw\x0b\
+\x82\x94\x1f\x1f^m,\x8f\x85\x8f\xd0\xaa\x09Ya5\
+\x8f \x03G\x85Q\xa4p\xc4\x98\xc8\x88Il\x91b\
+`{\xb1dwP\x07wXU\x14\xfa\xb0z\x9b\x0c\
+\xc5\xce4\xfbe\x0aO\xa7~\xfb\x10\x93\xf0\x0c\x95\xf0\
+\xd2A\x848\xe4\xc9\xc1\xe0\xf8O<\xf67^\xf7\xd0\
+U\x8c\xe9\x94\xea\x12\xa4J\xfa{\x06!=~gq\
+\xab\xf1S\xa9\x01\
+"
+
+qt_resource_name = b"\
+\x00\x06\
+\x07\xae\xc3\xc3\
+\x00t\
+\x00h\x00e\x00m\x00e\x00s\
+\x00\x08\
+\x08\x8eU\xe3\
+\x00d\
+\x00a\x00r\x00k\x00.\x00q\x00s\x00s\
+\x00\x09\
+\x0d\xf7\xbdC\
+\x00l\
+\x00i\x00g\x00h\x00t\x00.\x00q\x00s\x00s\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x12\x00\x04\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\xa1A\xa2z\xe8\
+\x00\x00\x00(\x00\x04\x00\x00\x00\x01\x00\x00\x03z\
+\x00\x00\x01\xa1A\xa2z\xe9\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()